@@ -1,8 +1,10 @@
 """Command-line ingestor that reads from stdin."""
 
+import codecs
 import sys
 from typing import Dict, List, Optional, Any
 
+import orjson
 from dagster import Config, In, OpExecutionContext, get_dagster_logger, op
 
 from pedster.ingestors.base_ingestor import BaseIngestor
@@ -12,6 +14,9 @@ from pedster.utils.models import ContentType, PipelineData
 
 logger = get_dagster_logger()
 
+# Bytes that continue a UTF-8 character rather than start one
+UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
 
 class CLIIngestorConfig(Config):
     """Configuration for CLI ingestor."""
@@ -45,6 +50,36 @@ class CLIIngestor(BaseIngestor):
         super().__init__(name, description, source_name, content_type, config)
         self.config_obj = CLIIngestorConfig(**(config or {}))
     
+    def _read_stdin_bytes(self) -> bytes:
+        """Read stdin as bytes, enough to hold max_size characters.
+        
+        Returns:
+            Raw bytes, at most four per character of max_size
+        """
+        max_size = self.config_obj.max_size
+        if max_size is None:
+            return sys.stdin.buffer.read()
+        return sys.stdin.buffer.read(max_size * 4)
+    
+    def _decode_text(self, raw: bytes) -> str:
+        """Decode UTF-8 input, honouring max_size in characters.
+        
+        An incomplete UTF-8 sequence at the end of a partial read is held
+        back rather than decoded, so the limit never splits a character.
+        
+        Args:
+            raw: Bytes returned by _read_stdin_bytes
+            
+        Returns:
+            Decoded text, at most max_size characters long
+        """
+        max_size = self.config_obj.max_size
+        if max_size is None:
+            return raw.decode("utf-8", errors="replace")
+        
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        return decoder.decode(raw, final=len(raw) < max_size * 4)[:max_size]
+    
     @track_metrics
     def ingest(self) -> List[PipelineData]:
         """Read data from stdin.
@@ -53,23 +88,40 @@ class CLIIngestor(BaseIngestor):
             List containing a PipelineData object with stdin content
         """
         logger.info("Reading from stdin...")
-        content = ""
+        content: Any = None
         
-        # Read from stdin
+        # Read raw bytes from stdin, decoding only as much as the format needs
         if not sys.stdin.isatty():  # Check if something is being piped in
-            content = sys.stdin.read(self.config_obj.max_size)
-            if self.config_obj.trim_whitespace:
-                content = content.strip()
+            raw = self._read_stdin_bytes()
+            if self.config_obj.input_format == "json" or self.content_type == ContentType.JSON:
+                # orjson parses the bytes directly; count characters without
+                # decoding by skipping UTF-8 continuation bytes
+                size = len(raw.translate(None, UTF8_CONTINUATION_BYTES))
+                max_size = self.config_obj.max_size
+                if max_size is not None and size > max_size:
+                    logger.error(f"JSON on stdin is longer than max_size ({max_size} characters)")
+                    return []
+                if raw.strip():
+                    try:
+                        content = orjson.loads(raw)
+                    except orjson.JSONDecodeError as e:
+                        logger.error(f"Invalid JSON on stdin: {str(e)}")
+                        return []
+            else:
+                text = self._decode_text(raw)
+                content = text.strip() if self.config_obj.trim_whitespace else text
+                size = len(content)
             
-            logger.info(f"Read {len(content)} characters from stdin")
+            logger.info(f"Read {size} characters from stdin")
         else:
             logger.warning("No input piped to stdin")
         
-        if not content:
+        # Falsy JSON values such as 0 or [] are valid content
+        if content is None or content == "":
             return []
         
         # Create pipeline data
-        metadata = {"size": len(content), "source": "stdin"}
+        metadata = {"size": size, "source": "stdin"}
         return [self.create_pipeline_data(content, metadata)]
 
 
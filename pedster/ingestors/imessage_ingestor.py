@@ -142,7 +142,7 @@ class IMessageIngestor(BaseIngestor):
                 
                 # Create new message
                 message = Message(
-                    thread_id=thread.id,
+                    thread=thread,
                     message_id=message_id,
                     text=message_data["text"],
                     from_me=message_data["from_me"],
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import feedparser
 import requests
 from dagster import Config, EnvVar, Field, OpExecutionContext, StringSource, asset, get_dagster_logger
+from sqlalchemy import false
 
 from pedster.ingestors.base_ingestor import BaseIngestor
 from pedster.utils.database import Episode, Podcast, get_db_session, init_db
@@ -134,12 +135,9 @@ class PodcastIngestor(BaseIngestor):
             # Convert new episodes to PipelineData
             if podcast_stats["new_episodes"] > 0:
                 # Get unprocessed episodes from this podcast
-                unprocessed = db_session.query(Episode).filter_by(
-                    podcast_id=podcast.id, processed=False
-                ).all()
-                
-                for episode in unprocessed:
-                    results.append(episode.to_pipeline_data())
+                results.extend(Episode.bulk_to_pipeline_data(
+                    db_session, Episode.podcast_id == podcast.id, Episode.processed == false()
+                ))
         
         logger.info(f"Ingested {len(results)} episodes from podcast feeds")
         return results
@@ -397,7 +395,7 @@ class PodcastIngestor(BaseIngestor):
                 
                 logger.info(f"Loaded Whisper model: {self.config_obj.whisper_model}")
             except ImportError:
-                raise ImportError("Whisper or torch not installed. Please install them with: pip install whisper torch")
+                raise ImportError("Whisper or torch not installed. Please install them with: pip install openai-whisper torch")
     
     def _transcribe_audio(self, audio_path: str, title: str, language: Optional[str] = None) -> str:
         """Transcribe audio file using Whisper.
@@ -13,9 +13,10 @@ import feedparser
 import requests
 from dagster import Config, EnvVar, Field, OpExecutionContext, StringSource, asset, get_dagster_logger
 from dateutil import parser as date_parser
+from sqlalchemy import false
 
 from pedster.ingestors.base_ingestor import BaseIngestor
-from pedster.utils.database import Article, Feed, get_db_session, init_db
+from pedster.utils.database import Article, Feed, bulk_insert, get_db_session, init_db
 from pedster.utils.metrics import track_metrics
 from pedster.utils.models import ContentType, PipelineData
 
@@ -92,6 +93,7 @@ class RSSIngestor(BaseIngestor):
         
         # Process feeds
         results = []
+        new_article_total = 0
         for feed_url in feed_urls:
             # Get feed from database or create new one
             feed = db_session.query(Feed).filter_by(url=feed_url).first()
@@ -125,14 +127,17 @@ class RSSIngestor(BaseIngestor):
             )
             
             # Convert new articles to PipelineData
+            new_article_total += feed_stats["new_articles"]
             if feed_stats["new_articles"] > 0:
                 # Get unprocessed articles from this feed
-                unprocessed = db_session.query(Article).filter_by(
-                    feed_id=feed.id, processed=False
-                ).all()
-                
-                for article in unprocessed:
-                    results.append(article.to_pipeline_data())
+                results.extend(Article.bulk_to_pipeline_data(
+                    db_session, Article.feed_id == feed.id, Article.processed == false()
+                ))
+        
+        # Recount feed statistics from the stored articles in one statement
+        if new_article_total > 0:
+            Feed.refresh_stats(db_session)
+            db_session.commit()
         
         logger.info(f"Ingested {len(results)} articles from RSS feeds")
         return results
@@ -189,7 +194,7 @@ class RSSIngestor(BaseIngestor):
             # Limit to max_articles
             sorted_entries = sorted_entries[:max_articles]
             
-            new_article_count = 0
+            new_articles: List[Dict[str, Any]] = []
             jina_enhanced_count = 0
             
             for entry, published_date in sorted_entries:
@@ -243,30 +248,31 @@ class RSSIngestor(BaseIngestor):
                 clean_content = self._clean_html(content)
                 
                 # Create new article
-                new_article = Article(
-                    feed_id=feed.id,
-                    title=entry.get("title", "Untitled"),
-                    url=article_url,
-                    guid=guid,
-                    description=entry.get("summary", ""),
-                    content=clean_content,
-                    author=entry.get("author", ""),
-                    published_at=published_date,
-                    fetched_at=datetime.utcnow(),
-                    processed=False,
-                    word_count=len(clean_content.split()) if clean_content else 0,
-                    jina_enhanced=jina_enhanced
-                )
+                new_article = {
+                    "feed_id": feed.id,
+                    "title": entry.get("title", "Untitled"),
+                    "url": article_url,
+                    "guid": guid,
+                    "description": entry.get("summary", ""),
+                    "content": clean_content,
+                    "author": entry.get("author", ""),
+                    "published_at": published_date,
+                    "fetched_at": datetime.utcnow(),
+                    "processed": False,
+                    "word_count": len(clean_content.split()) if clean_content else 0,
+                    "jina_enhanced": jina_enhanced,
+                }
                 
-                logger.info(f"New article: '{new_article.title[:50]}' ({new_article.word_count} words)")
+                logger.info(f"New article: '{new_article['title'][:50]}' ({new_article['word_count']} words)")
                 
-                db_session.add(new_article)
-                new_article_count += 1
+                new_articles.append(new_article)
+            
+            # Insert all new articles in one batch
+            new_article_count = bulk_insert(db_session, Article, new_articles)
             
             # Update feed last updated timestamp if new articles were found
             if new_article_count > 0:
                 feed.last_updated = datetime.utcnow()
-                feed.article_count += new_article_count
             
             # Reset error count if successful
             feed.error_count = 0
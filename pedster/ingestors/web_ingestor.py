@@ -1,12 +1,13 @@
 """Web content ingestor using Jina."""
 
-import json
 from typing import Any, Dict, List, Optional, Union
 
 import requests
+from bs4 import BeautifulSoup
 from dagster import Config, get_dagster_logger
 
 from pedster.ingestors.base_ingestor import BaseIngestor
+from pedster.utils.http import create_session
 from pedster.utils.metrics import track_metrics
 from pedster.utils.models import ContentType, PipelineData
 
@@ -22,6 +23,7 @@ class WebIngestorConfig(Config):
     include_images: bool = False
     extract_text: bool = True
     timeout: int = 30
+    max_bytes: int = 5_000_000
     user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 
 
@@ -51,6 +53,9 @@ class WebIngestor(BaseIngestor):
             raise ValueError("urls must be provided in config")
         
         self.config_obj = WebIngestorConfig(**(config or {}))
+        
+        # Reuse pooled connections across URLs
+        self._session = create_session()
     
     @track_metrics
     def _extract_content_with_jina(self, url: str) -> Dict[str, Any]:
@@ -78,27 +83,45 @@ class WebIngestor(BaseIngestor):
         
         # For now, just fetch the raw HTML
         try:
-            response = requests.get(
+            with self._session.get(
                 url, 
                 headers=headers, 
-                timeout=self.config_obj.timeout
-            )
-            response.raise_for_status()
+                timeout=self.config_obj.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                
+                # Read the body up to max_bytes
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.config_obj.max_bytes:
+                        logger.warning(f"Response from {url} exceeds {self.config_obj.max_bytes} bytes, truncating")
+                        break
+                body = b"".join(chunks)[:self.config_obj.max_bytes]
+                encoding = response.encoding or "utf-8"
+                status_code = response.status_code
             
-            # Extract title from HTML
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, "html.parser")
-            title = soup.title.string if soup.title else "No title"
+            # Extract title from HTML; str() detaches it from the parse tree
+            soup = BeautifulSoup(body, "html.parser")
+            title = str(soup.title.string) if soup.title and soup.title.string else "No title"
             
-            # Simple text extraction
-            text = soup.get_text(separator="\n", strip=True)
+            # Only build the representation the caller will use
+            if self.config_obj.extract_text:
+                text = soup.get_text(separator="\n", strip=True)
+                html = ""
+            else:
+                text = ""
+                html = body.decode(encoding, errors="replace")
             
             return {
                 "url": url,
                 "title": title,
                 "text": text,
-                "html": response.text,
-                "status_code": response.status_code,
+                "html": html,
+                "status_code": status_code,
             }
             
         except requests.RequestException as e:
@@ -1,5 +1,6 @@
 """Base output class for all outputs."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 
@@ -38,9 +39,12 @@ class BaseOutput(ABC):
         self.description = description
         
         if isinstance(accepted_types, list):
-            self.accepted_types = accepted_types
+            self.accepted_types = list(accepted_types)
         else:
             self.accepted_types = [accepted_types]
+        
+        # Set view of accepted types for constant-time membership checks
+        self._accepted_set = frozenset(self.accepted_types)
             
         self.config = config or {}
     
@@ -56,7 +60,7 @@ class BaseOutput(ABC):
         if isinstance(data, ProcessorResult):
             data = data.data
             
-        return data.content_type in self.accepted_types
+        return data.content_type in self._accepted_set
     
     @abstractmethod
     def output(self, data: Union[PipelineData, ProcessorResult]) -> bool:
@@ -70,6 +74,42 @@ class BaseOutput(ABC):
         """
         pass
     
+    async def output_async(self, data: Union[PipelineData, ProcessorResult]) -> bool:
+        """Output the given data without blocking the event loop.
+        
+        Subclasses can override this with natively asynchronous I/O. The
+        default implementation runs output in the loop's default executor.
+        
+        Args:
+            data: The data to output
+            
+        Returns:
+            True if output succeeded, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.output, data)
+    
+    def output_batch(self, items: List[Union[PipelineData, ProcessorResult]]) -> List[bool]:
+        """Output a batch of data.
+        
+        Subclasses can override this to amortize per-item overhead across
+        the batch. The default implementation outputs items one by one.
+        
+        Args:
+            items: The data to output
+            
+        Returns:
+            List of success flags, one per item and in the same order
+        """
+        results = []
+        for data in items:
+            try:
+                results.append(self.output(data))
+            except Exception as e:
+                logger.error(f"Error outputting data: {str(e)}")
+                results.append(False)
+        return results
+    
     def get_asset(self, input_assets: List[str], **kwargs: Any) -> Any:
         """Get an asset decorator for this output.
         
@@ -95,26 +135,31 @@ class BaseOutput(ABC):
             
             # Process all inputs
             for asset_name, data_list in inputs.items():
+                batch = []
                 for data in data_list:
-                    if self.can_output(data):
-                        try:
-                            context.log.info(f"Outputting data from {asset_name} with {self.name}")
-                            success = self.output(data)
-                            results.append(success)
-                            
-                            if success:
-                                context.log.info(f"Successfully output data")
-                            else:
-                                context.log.error(f"Failed to output data")
-                                
-                        except Exception as e:
-                            context.log.error(f"Error outputting data: {str(e)}")
-                            results.append(False)
+                    # Unwrap processor results once per item
+                    pipeline_data = data.data if isinstance(data, ProcessorResult) else data
+                    
+                    if pipeline_data.content_type in self._accepted_set:
+                        batch.append(pipeline_data)
                     else:
                         context.log.warning(
                             f"Output {self.name} cannot handle data of type "
-                            f"{data.data.content_type if isinstance(data, ProcessorResult) else data.content_type}"
+                            f"{pipeline_data.content_type}"
                         )
+                
+                if not batch:
+                    continue
+                
+                context.log.info(f"Outputting {len(batch)} items from {asset_name} with {self.name}")
+                batch_results = self.output_batch(batch)
+                results.extend(batch_results)
+                
+                succeeded = sum(batch_results)
+                if succeeded:
+                    context.log.info(f"Successfully output {succeeded} items")
+                if succeeded < len(batch_results):
+                    context.log.error(f"Failed to output {len(batch_results) - succeeded} items")
             
             return results
         
@@ -1,6 +1,12 @@
 """iMessage output using applescript."""
 
+import atexit
+import functools
+import os
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 
 from dagster import Config, get_dagster_logger
@@ -12,6 +18,60 @@ from pedster.utils.models import ContentType, PipelineData, ProcessorResult
 
 logger = get_dagster_logger()
 
+# Message and recipient are passed as argv so they never need escaping
+SEND_IMESSAGE_APPLESCRIPT = """on run argv
+    tell application "Messages"
+        send (item 1 of argv) to buddy (item 2 of argv) of service 1
+    end tell
+end run"""
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_applescript(script: str) -> Optional[str]:
+    """Compile an AppleScript to a .scpt file with osacompile.
+    
+    Each script is compiled once per process and shared by every output;
+    the temporary directory holding it is removed at interpreter exit.
+    
+    Args:
+        script: AppleScript source
+        
+    Returns:
+        Path to the compiled script, or None if it could not be compiled
+    """
+    if shutil.which("osacompile") is None:
+        logger.debug("osacompile not available, using uncompiled AppleScript")
+        return None
+    
+    script_dir = tempfile.mkdtemp(prefix="pedster_imessage_")
+    try:
+        source_path = os.path.join(script_dir, "send_imessage.applescript")
+        compiled_path = os.path.join(script_dir, "send_imessage.scpt")
+        
+        with open(source_path, "w", encoding="utf-8") as f:
+            f.write(script)
+        
+        subprocess.run(
+            ["osacompile", "-o", compiled_path, source_path],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"Error compiling AppleScript: {e.stderr}")
+        shutil.rmtree(script_dir, ignore_errors=True)
+        return None
+        
+    except Exception as e:
+        logger.warning(f"Error compiling AppleScript: {str(e)}")
+        shutil.rmtree(script_dir, ignore_errors=True)
+        return None
+    
+    atexit.register(shutil.rmtree, script_dir, ignore_errors=True)
+    logger.info(f"Compiled iMessage AppleScript to {compiled_path}")
+    return compiled_path
+
 
 class IMessageOutputConfig(Config):
     """Configuration for iMessage output."""
@@ -22,6 +82,7 @@ class IMessageOutputConfig(Config):
     split_long_messages: bool = False
     add_prefix: Optional[str] = None
     add_suffix: Optional[str] = None
+    max_workers: int = 8
 
 
 class IMessageOutput(BaseOutput):
@@ -48,6 +109,13 @@ class IMessageOutput(BaseOutput):
             raise ValueError("recipients must be provided in config")
         
         self.config_obj = IMessageOutputConfig(**(config or {}))
+        
+        # Compile the send script once so osascript skips parsing on every send
+        compiled_script_path = _compile_applescript(SEND_IMESSAGE_APPLESCRIPT)
+        if compiled_script_path:
+            self._osascript_command = ["osascript", compiled_script_path]
+        else:
+            self._osascript_command = ["osascript", "-e", SEND_IMESSAGE_APPLESCRIPT]
     
     def _send_imessage(self, recipient: str, message: str) -> bool:
         """Send an iMessage using AppleScript.
@@ -60,19 +128,9 @@ class IMessageOutput(BaseOutput):
             True if sending succeeded, False otherwise
         """
         try:
-            # Escape double quotes in message
-            escaped_message = message.replace('"', '\\"')
-            
-            # Create the AppleScript command
-            applescript = f'''
-                tell application "Messages"
-                    send "{escaped_message}" to buddy "{recipient}" of service 1
-                end tell
-            '''
-            
-            # Run the AppleScript
+            # Run the AppleScript with message and recipient as arguments
             subprocess.run(
-                ["osascript", "-e", applescript],
+                [*self._osascript_command, message, recipient],
                 check=True,
                 capture_output=True,
                 text=True,
@@ -89,6 +147,27 @@ class IMessageOutput(BaseOutput):
             logger.error(f"Error sending iMessage: {str(e)}")
             return False
     
+    def _send_to_recipients(self, message: str) -> bool:
+        """Send a message to all recipients in parallel.
+        
+        Args:
+            message: The message to send
+            
+        Returns:
+            True if sending succeeded for every recipient, False otherwise
+        """
+        recipients = self.config_obj.recipients
+        if len(recipients) <= 1:
+            return all(self._send_imessage(recipient, message) for recipient in recipients)
+        
+        max_workers = min(self.config_obj.max_workers, len(recipients))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(lambda recipient: self._send_imessage(recipient, message), recipients)
+            )
+        
+        return all(results)
+    
     def _format_message(self, data: Union[PipelineData, ProcessorResult]) -> str:
         """Format content for sending as a message.
         
@@ -126,6 +205,49 @@ class IMessageOutput(BaseOutput):
         
         return content
     
+    def _split_message(self, message: str) -> List[str]:
+        """Split a long message into chunks of at most max_length characters.
+        
+        Prefers breaking on paragraph boundaries, then line breaks, then
+        sentence ends. Searches are bounded with rfind offsets so no
+        intermediate substrings are allocated while looking for a break.
+        
+        Args:
+            message: The message to split
+            
+        Returns:
+            List of message chunks
+        """
+        chunk_size = self.config_obj.max_length
+        length = len(message)
+        chunks = []
+        start = 0
+        
+        while start < length:
+            end = start + chunk_size
+            if end >= length:
+                chunks.append(message[start:])
+                break
+            
+            # Find a good breaking point
+            break_point = message.rfind("\n\n", start, end)
+            if break_point <= start:
+                break_point = message.rfind("\n", start, end)
+            if break_point <= start:
+                # Keep the period with its sentence
+                break_point = message.rfind(". ", start, end) + 1
+            if break_point <= start:
+                break_point = end
+            
+            chunks.append(message[start:break_point])
+            
+            # Skip leading whitespace of the next chunk
+            start = break_point
+            while start < length and message[start].isspace():
+                start += 1
+        
+        return chunks
+    
     @track_metrics
     def output(self, data: Union[PipelineData, ProcessorResult]) -> bool:
         """Send data as iMessage.
@@ -141,26 +263,7 @@ class IMessageOutput(BaseOutput):
             
             if self.config_obj.split_long_messages and len(message) > self.config_obj.max_length:
                 # Split message into chunks
-                chunks = []
-                remaining = message
-                chunk_size = self.config_obj.max_length
-                
-                while remaining:
-                    if len(remaining) <= chunk_size:
-                        chunks.append(remaining)
-                        remaining = ""
-                    else:
-                        # Find a good breaking point
-                        break_point = remaining[:chunk_size].rfind("\n\n")
-                        if break_point == -1:
-                            break_point = remaining[:chunk_size].rfind("\n")
-                        if break_point == -1:
-                            break_point = remaining[:chunk_size].rfind(". ")
-                        if break_point == -1:
-                            break_point = chunk_size
-                        
-                        chunks.append(remaining[:break_point])
-                        remaining = remaining[break_point:].lstrip()
+                chunks = self._split_message(message)
                 
                 # Send messages in chunks
                 success = True
@@ -170,20 +273,14 @@ class IMessageOutput(BaseOutput):
                         chunk = f"[Part {i+1}/{len(chunks)}]\n\n{chunk}"
                     
                     # Send to all recipients
-                    for recipient in self.config_obj.recipients:
-                        if not self._send_imessage(recipient, chunk):
-                            success = False
+                    if not self._send_to_recipients(chunk):
+                        success = False
                 
                 return success
                 
             else:
                 # Send single message to all recipients
-                success = True
-                for recipient in self.config_obj.recipients:
-                    if not self._send_imessage(recipient, message):
-                        success = False
-                
-                return success
+                return self._send_to_recipients(message)
                 
         except Exception as e:
             logger.error(f"Error in iMessage output: {str(e)}")
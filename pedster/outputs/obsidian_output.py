@@ -1,19 +1,31 @@
 """Obsidian markdown output."""
 
+import asyncio
 import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from dagster import Config, get_dagster_logger
 
 from pedster.outputs.base_output import BaseOutput
 from pedster.utils.metrics import track_metrics
 from pedster.utils.models import ContentType, PipelineData, ProcessorResult
+from pedster.utils.templates import compile_template
 
 
 logger = get_dagster_logger()
 
+# Anything other than word characters (alphanumerics and "_"), spaces and "-"
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Timestamp footers live at the end of a note, so only its tail is searched
+TIMESTAMP_MARKER = "Generated on "
+TIMESTAMP_SEARCH_WINDOW = 256
+
 
 class ObsidianOutputConfig(Config):
     """Configuration for Obsidian output."""
@@ -30,6 +42,7 @@ class ObsidianOutputConfig(Config):
     add_timestamp: bool = True
     add_frontmatter: bool = True
     tags: List[str] = []
+    max_workers: int = 8
 
 
 class ObsidianOutput(BaseOutput):
@@ -56,6 +69,54 @@ class ObsidianOutput(BaseOutput):
             raise ValueError("vault_path must be provided in config")
         
         self.config_obj = ObsidianOutputConfig(**(config or {}))
+        
+        # Frontmatter skeleton and configured tags are fixed per instance, so
+        # they are encoded once; only the per-note values are encoded and
+        # substituted when formatting
+        self._frontmatter_template = (
+            b"---\n"
+            b"title: \"%(title)s\"\n"
+            b"date: %(date)s\n"
+            b"source: %(source)s\n"
+            b"%(tags_block)s"
+            b"%(extra)s"
+            b"---\n\n"
+        )
+        self._tag_lines = tuple(f"  - {tag}\n".encode("utf-8") for tag in self.config_obj.tags)
+        
+        # Parse the file and content templates once rather than on every note
+        self._format_file_name = compile_template(self.config_obj.file_template)
+        self._format_content_template = (
+            compile_template(self.config_obj.content_template)
+            if self.config_obj.content_template
+            else None
+        )
+        
+        # Base directory for notes is fixed per instance
+        base_path = Path(self.config_obj.vault_path)
+        if self.config_obj.folder:
+            base_path = base_path / self.config_obj.folder
+        self._base_dir = os.fspath(base_path)
+        
+        # Resolve how existing files are handled once; append wins over
+        # prepend, which wins over overwrite, and the default is a new
+        # uniquely named file
+        if self.config_obj.append:
+            self._mode = "append"
+        elif self.config_obj.prepend:
+            self._mode = "prepend"
+        elif self.config_obj.overwrite:
+            self._mode = "overwrite"
+        else:
+            self._mode = "unique"
+        self._existing_file_writers: Dict[str, Callable[[str, bytes, datetime], None]] = {
+            "append": self._append_to_file,
+            "prepend": self._prepend_to_file,
+            "unique": self._write_unique_file,
+        }
+        
+        # Directories already known to exist, to skip repeated stat calls
+        self._known_dirs: Set[str] = set()
     
     def _ensure_directory_exists(self, directory: str) -> bool:
         """Ensure the directory exists, creating it if necessary.
@@ -66,140 +127,242 @@ class ObsidianOutput(BaseOutput):
         Returns:
             True if the directory exists or was created, False otherwise
         """
+        if directory in self._known_dirs:
+            return True
+        
         if not os.path.exists(directory):
             if self.config_obj.create_folders:
                 try:
                     os.makedirs(directory, exist_ok=True)
                     logger.info(f"Created directory: {directory}")
-                    return True
                 except Exception as e:
                     logger.error(f"Error creating directory {directory}: {str(e)}")
                     return False
             else:
                 logger.warning(f"Directory does not exist: {directory}")
                 return False
+        
+        self._known_dirs.add(directory)
         return True
     
-    def _get_file_path(self, data: Union[PipelineData, ProcessorResult]) -> str:
+    def _get_file_path(self, data: PipelineData, now: Optional[datetime] = None) -> str:
         """Get the file path for the given data.
         
         Args:
             data: The data to output
+            now: Timestamp for date/time placeholders (defaults to the current time)
             
         Returns:
             File path
         """
-        # Extract content data
-        if isinstance(data, ProcessorResult):
-            data = data.data
-        
-        # Get base path
-        base_path = Path(self.config_obj.vault_path)
-        
-        # Add folder if specified
-        if self.config_obj.folder:
-            base_path = base_path / self.config_obj.folder
+        if now is None:
+            now = datetime.now()
         
         # Create folder if needed
-        if not self._ensure_directory_exists(str(base_path)):
-            raise OSError(f"Cannot create or access directory: {base_path}")
+        if not self._ensure_directory_exists(self._base_dir):
+            raise OSError(f"Cannot create or access directory: {self._base_dir}")
         
         # Get title for file name
         title = data.metadata.get("title", "Untitled")
         
         # Clean title for filename
-        safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
-        safe_title = safe_title.strip().replace(" ", "_")
+        safe_title = UNSAFE_FILENAME_CHARS.sub("_", title).strip().replace(" ", "_")
         
         # Format file name using template
-        file_name = self.config_obj.file_template.format(
-            title=safe_title,
-            date=datetime.now().strftime("%Y-%m-%d"),
-            time=datetime.now().strftime("%H-%M-%S"),
-            id=data.id,
-            source=data.source,
-        )
+        file_name = self._format_file_name({
+            "title": safe_title,
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H-%M-%S"),
+            "id": data.id,
+            "source": data.source,
+        })
         
         # Ensure file has .md extension
         if not file_name.endswith(".md"):
             file_name += ".md"
         
-        return str(base_path / file_name)
+        return os.path.join(self._base_dir, file_name)
     
-    def _format_content(self, data: Union[PipelineData, ProcessorResult]) -> str:
-        """Format content for output.
+    def _format_content_bytes(self, data: PipelineData, now: Optional[datetime] = None) -> bytes:
+        """Format content for output as UTF-8 bytes ready to be written.
         
         Args:
             data: The data to output
+            now: Timestamp for dates in the note (defaults to the current time)
             
         Returns:
-            Formatted content
+            Formatted content, encoded
         """
-        # Extract content data
-        if isinstance(data, ProcessorResult):
-            data = data.data
-        
         content = data.content
+        if now is None:
+            now = datetime.now()
         
         # Apply template if specified
-        if self.config_obj.content_template:
-            template = self.config_obj.content_template
+        if self._format_content_template is not None:
             metadata = data.metadata
             
-            # Format template with metadata
-            formatted_content = template.format(
-                content=content,
-                title=metadata.get("title", "Untitled"),
-                date=datetime.now().strftime("%Y-%m-%d"),
-                time=datetime.now().strftime("%H-%M-%S"),
-                id=data.id,
-                source=data.source,
-                **metadata
-            )
-            
-            content = formatted_content
+            # Format template with metadata; the standard fields take
+            # precedence over metadata keys of the same name
+            content = self._format_content_template({
+                **metadata,
+                "content": content,
+                "title": metadata.get("title", "Untitled"),
+                "date": now.strftime("%Y-%m-%d"),
+                "time": now.strftime("%H-%M-%S"),
+                "id": data.id,
+                "source": data.source,
+            })
+        
+        # Assemble the encoded note from parts so the body is copied only once
+        parts = []
         
-        # Add frontmatter if requested
-        if self.config_obj.add_frontmatter:
-            title = data.metadata.get("title", "Untitled")
-            date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Add frontmatter if requested, unless content already has it
+        if self.config_obj.add_frontmatter and not content.startswith("---"):
+            metadata = data.metadata
             
             # Prepare tags
-            tags = self.config_obj.tags.copy()
-            if "tags" in data.metadata and isinstance(data.metadata["tags"], list):
-                tags.extend(data.metadata["tags"])
-            
-            # Create frontmatter
-            frontmatter = "---\n"
-            frontmatter += f"title: \"{title}\"\n"
-            frontmatter += f"date: {date}\n"
-            frontmatter += f"source: {data.source}\n"
-            
-            if tags:
-                frontmatter += "tags:\n"
-                for tag in tags:
-                    frontmatter += f"  - {tag}\n"
+            tag_lines = self._tag_lines
+            extra_tags = metadata.get("tags")
+            if isinstance(extra_tags, list):
+                tag_lines += tuple(f"  - {tag}\n".encode("utf-8") for tag in extra_tags)
+            tags_block = b"".join((b"tags:\n", *tag_lines)) if tag_lines else b""
             
             # Add extra metadata
-            for key, value in data.metadata.items():
-                if key != "title" and key != "tags" and isinstance(value, (str, int, float, bool)):
-                    frontmatter += f"{key}: {value}\n"
-            
-            frontmatter += "---\n\n"
+            extra = "".join(
+                f"{key}: {value}\n"
+                for key, value in metadata.items()
+                if key != "title" and key != "tags" and isinstance(value, (str, int, float, bool))
+            )
             
-            # Only add frontmatter if content doesn't already have it
-            if not content.startswith("---"):
-                content = frontmatter + content
+            parts.append(self._frontmatter_template % {
+                b"title": str(metadata.get("title", "Untitled")).encode("utf-8"),
+                b"date": now.strftime("%Y-%m-%d %H:%M:%S").encode("ascii"),
+                b"source": data.source.encode("utf-8"),
+                b"tags_block": tags_block,
+                b"extra": extra.encode("utf-8"),
+            })
         
-        # Add timestamp if requested
-        if self.config_obj.add_timestamp and not self.config_obj.add_frontmatter:
-            timestamp = f"> Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            
-            # Add timestamp at the end if not already present
-            if "Generated on " not in content:
-                content += f"\n\n{timestamp}"
+        parts.append(content.encode("utf-8"))
+        
+        # Add timestamp at the end if requested and not already present
+        if (
+            self.config_obj.add_timestamp
+            and not self.config_obj.add_frontmatter
+            and content.find(TIMESTAMP_MARKER, max(0, len(content) - TIMESTAMP_SEARCH_WINDOW)) == -1
+        ):
+            parts.append(f"\n\n> {TIMESTAMP_MARKER}{now.strftime('%Y-%m-%d %H:%M:%S')}\n\n".encode("utf-8"))
         
-        return content
+        return b"".join(parts)
+    
+    def _write_bytes(self, file_path: str, payload: bytes, mode: str = "wb") -> None:
+        """Write an encoded payload with unbuffered I/O.
+        
+        The payload is already fully encoded, so a buffered writer would only
+        add a copy; writing through the raw file usually takes one syscall.
+        
+        Args:
+            file_path: Target file path
+            payload: Encoded content
+            mode: Binary file mode ("wb", "xb" or "ab")
+        """
+        with open(file_path, mode, buffering=0) as f:
+            view = memoryview(payload)
+            while view:
+                view = view[f.write(view):]
+    
+    def _append_to_file(self, file_path: str, payload: bytes, now: datetime) -> None:
+        """Append an encoded payload to an existing file.
+        
+        Args:
+            file_path: Existing file path
+            payload: Encoded content to append
+            now: Timestamp of the write (unused)
+        """
+        self._write_bytes(file_path, b"\n\n" + payload, mode="ab")
+        logger.info(f"Appended to file: {file_path}")
+    
+    def _prepend_to_file(self, file_path: str, payload: bytes, now: datetime) -> None:
+        """Prepend an encoded payload to an existing file.
+        
+        The new content is written to a temporary file, the existing note is
+        streamed after it in fixed-size blocks, and the temporary file then
+        atomically replaces the original. Memory use stays constant no
+        matter how large the existing note has grown.
+        
+        Args:
+            file_path: Existing file path
+            payload: Encoded content to prepend
+            now: Timestamp of the write (unused)
+        """
+        temp_path = f"{file_path}.tmp"
+        try:
+            with open(temp_path, "wb") as out_file:
+                out_file.write(payload)
+                out_file.write(b"\n\n")
+                with open(file_path, "rb") as in_file:
+                    shutil.copyfileobj(in_file, out_file, length=65536)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        logger.info(f"Prepended to file: {file_path}")
+    
+    def _write_unique_file(self, file_path: str, payload: bytes, now: datetime) -> None:
+        """Write an encoded payload next to an existing file under a unique name.
+        
+        The name gets a timestamp suffix, plus a counter when that name is
+        taken too. Each candidate is created exclusively, so an existing file
+        is never overwritten.
+        
+        Args:
+            file_path: Existing file path
+            payload: Encoded content to write
+            now: Timestamp used for the unique file name
+        """
+        file_name = os.path.basename(file_path)
+        base_name = os.path.splitext(file_name)[0]
+        dir_name = os.path.dirname(file_path)
+        
+        # Add timestamp to filename
+        timestamp = now.strftime("%Y%m%d%H%M%S")
+        new_path = os.path.join(dir_name, f"{base_name}_{timestamp}.md")
+        
+        counter = 1
+        while True:
+            try:
+                self._write_bytes(new_path, payload, mode="xb")
+                break
+            except FileExistsError:
+                new_path = os.path.join(dir_name, f"{base_name}_{timestamp}_{counter}.md")
+                counter += 1
+        logger.info(f"Created new file: {new_path}")
+    
+    def _write_file(self, file_path: str, payload: bytes, now: Optional[datetime] = None) -> None:
+        """Write a formatted note, honouring the existing-file mode.
+        
+        Args:
+            file_path: Target file path
+            payload: Formatted content, encoded
+            now: Timestamp of the write (defaults to the current time)
+        """
+        # Overwriting writes the same bytes whether or not the file exists
+        if self._mode == "overwrite":
+            self._write_bytes(file_path, payload)
+            logger.info(f"Wrote file: {file_path}")
+            return
+        
+        # Exclusive creation ("x" opens with O_CREAT | O_EXCL) checks for an
+        # existing file and creates a new one in a single atomic call
+        try:
+            self._write_bytes(file_path, payload, mode="xb")
+            logger.info(f"Created file: {file_path}")
+            return
+        except FileExistsError:
+            pass
+        
+        # Handle existing file according to the configured mode
+        self._existing_file_writers[self._mode](file_path, payload, now or datetime.now())
     
     @track_metrics
     def output(self, data: Union[PipelineData, ProcessorResult]) -> bool:
@@ -212,57 +375,137 @@ class ObsidianOutput(BaseOutput):
             True if output succeeded, False otherwise
         """
         try:
-            file_path = self._get_file_path(data)
-            content = self._format_content(data)
+            # Unwrap processor results once for both helpers
+            if isinstance(data, ProcessorResult):
+                data = data.data
             
-            # Check if file exists
-            file_exists = os.path.exists(file_path)
+            # Take the time once for the file name, the note and any unique name
+            now = datetime.now()
+            file_path = self._get_file_path(data, now)
+            payload = self._format_content_bytes(data, now)
+            self._write_file(file_path, payload, now)
+            return True
             
-            if file_exists:
-                # Handle existing file
-                if self.config_obj.append:
-                    # Append to file
-                    with open(file_path, "a", encoding="utf-8") as f:
-                        f.write(f"\n\n{content}")
-                    logger.info(f"Appended to file: {file_path}")
-                    
-                elif self.config_obj.prepend:
-                    # Prepend to file
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        existing_content = f.read()
-                    
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(f"{content}\n\n{existing_content}")
-                    logger.info(f"Prepended to file: {file_path}")
-                    
-                elif self.config_obj.overwrite:
-                    # Overwrite file
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    logger.info(f"Overwrote file: {file_path}")
-                    
-                else:
-                    # Default: create new file with unique name
-                    file_name = os.path.basename(file_path)
-                    base_name = os.path.splitext(file_name)[0]
-                    dir_name = os.path.dirname(file_path)
-                    
-                    # Add timestamp to filename
-                    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-                    new_path = os.path.join(dir_name, f"{base_name}_{timestamp}.md")
-                    
-                    with open(new_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    logger.info(f"Created new file: {new_path}")
-                    
-            else:
-                # Create new file
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                logger.info(f"Created file: {file_path}")
+        except Exception as e:
+            logger.error(f"Error outputting to Obsidian: {str(e)}")
+            return False
+    
+    async def _write_file_async(self, file_path: str, payload: bytes, now: datetime) -> None:
+        """Write a formatted note with aiofiles, honouring the existing-file mode.
+        
+        Args:
+            file_path: Target file path
+            payload: Formatted content, encoded
+            now: Timestamp of the write
+            
+        Raises:
+            ImportError: If aiofiles is not installed
+        """
+        try:
+            import aiofiles
+        except ImportError:
+            raise ImportError("aiofiles not installed. Please install it with: pip install aiofiles")
+        
+        if self._mode == "overwrite":
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(payload)
+            logger.info(f"Wrote file: {file_path}")
+            return
+        
+        try:
+            async with aiofiles.open(file_path, "xb") as f:
+                await f.write(payload)
+            logger.info(f"Created file: {file_path}")
+            return
+        except FileExistsError:
+            pass
+        
+        if self._mode == "append":
+            async with aiofiles.open(file_path, "ab") as f:
+                await f.write(b"\n\n" + payload)
+            logger.info(f"Appended to file: {file_path}")
+            return
+        
+        # Prepend and unique names need several file operations, so the
+        # synchronous writer runs in the loop's default executor instead
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._existing_file_writers[self._mode], file_path, payload, now
+        )
+    
+    async def output_async(self, data: Union[PipelineData, ProcessorResult]) -> bool:
+        """Output data to an Obsidian markdown file using asynchronous file I/O.
+        
+        Several notes can be in flight at once, which helps most when the
+        vault lives on high-latency storage such as a network share. Callers
+        writing several items to the same note should await them in order.
+        
+        Args:
+            data: The data to output
             
+        Returns:
+            True if output succeeded, False otherwise
+        """
+        try:
+            # Unwrap processor results once for both helpers
+            if isinstance(data, ProcessorResult):
+                data = data.data
+            
+            now = datetime.now()
+            file_path = self._get_file_path(data, now)
+            payload = self._format_content_bytes(data, now)
+            await self._write_file_async(file_path, payload, now)
             return True
             
         except Exception as e:
             logger.error(f"Error outputting to Obsidian: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    @track_metrics
+    def output_batch(self, items: List[Union[PipelineData, ProcessorResult]]) -> List[bool]:
+        """Output a batch of data to Obsidian markdown files.
+        
+        All file paths and contents are resolved up front, then notes are
+        written concurrently. Items that resolve to the same file are written
+        in order by a single worker so append/prepend/unique-name handling
+        behaves as it would sequentially.
+        
+        Args:
+            items: The data to output
+            
+        Returns:
+            List of success flags, one per item and in the same order
+        """
+        results = [False] * len(items)
+        now = datetime.now()
+        
+        # Resolve paths and content, grouping items by target file
+        groups: Dict[str, List[Tuple[int, bytes]]] = {}
+        for index, data in enumerate(items):
+            if isinstance(data, ProcessorResult):
+                data = data.data
+            try:
+                file_path = self._get_file_path(data, now)
+                payload = self._format_content_bytes(data, now)
+                groups.setdefault(file_path, []).append((index, payload))
+            except Exception as e:
+                logger.error(f"Error outputting to Obsidian: {str(e)}")
+        
+        def write_group(file_path: str, entries: List[Tuple[int, bytes]]) -> None:
+            for index, payload in entries:
+                try:
+                    self._write_file(file_path, payload, now)
+                    results[index] = True
+                except Exception as e:
+                    logger.error(f"Error outputting to Obsidian: {str(e)}")
+        
+        if len(groups) <= 1:
+            for file_path, entries in groups.items():
+                write_group(file_path, entries)
+        else:
+            max_workers = min(self.config_obj.max_workers, len(groups))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Consume the iterator so worker exceptions surface here
+                list(executor.map(write_group, groups.keys(), groups.values()))
+        
+        return results
@@ -1,8 +1,11 @@
 """Base processor class for all processors."""
 
-import copy
+import asyncio
+import atexit
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from dagster import AssetIn, In, OpExecutionContext, asset, get_dagster_logger, op
 
@@ -12,6 +15,33 @@ from pedster.utils.models import ContentType, PipelineData, ProcessorResult
 
 logger = get_dagster_logger()
 
+# Executors shared by all processors, keyed by executor class and size
+_executors: Dict[Tuple[Type[Executor], int], Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_shared_executor(executor_cls: Type[Executor], max_workers: int) -> Executor:
+    """Get a long-lived executor, creating it on first use.
+    
+    Reusing executors avoids starting and joining worker threads or
+    processes on every batch. Executors are shut down at interpreter exit.
+    
+    Args:
+        executor_cls: Executor class
+        max_workers: Maximum number of workers
+        
+    Returns:
+        Shared executor
+    """
+    key = (executor_cls, max_workers)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = executor_cls(max_workers=max_workers)
+            _executors[key] = executor
+            atexit.register(executor.shutdown)
+        return executor
+
 
 class BaseProcessor(ABC):
     """Base class for all processors."""
@@ -21,6 +51,12 @@ class BaseProcessor(ABC):
     input_type: Union[ContentType, List[ContentType]]
     output_type: ContentType
     
+    # Executor used by process_batch to process items concurrently. Processing is
+    # usually I/O bound (API calls), so threads are the default; CPU-bound
+    # processors can set a ProcessPoolExecutor or max_workers = 1.
+    executor_cls: Type[Executor] = ThreadPoolExecutor
+    max_workers: int = 8
+    
     def __init__(
         self,
         name: str,
@@ -42,6 +78,12 @@ class BaseProcessor(ABC):
         self.description = description
         self.input_type = input_type
         self.output_type = output_type
+        
+        # Set view of input types for constant-time membership checks
+        if isinstance(input_type, list):
+            self._input_types = frozenset(input_type)
+        else:
+            self._input_types = frozenset((input_type,))
         self.config = config or {}
     
     def can_process(self, data: PipelineData) -> bool:
@@ -53,9 +95,7 @@ class BaseProcessor(ABC):
         Returns:
             True if this processor can handle the data, False otherwise
         """
-        if isinstance(self.input_type, list):
-            return data.content_type in self.input_type
-        return data.content_type == self.input_type
+        return data.content_type in self._input_types
     
     @abstractmethod
     def process(self, data: PipelineData) -> ProcessorResult:
@@ -69,6 +109,52 @@ class BaseProcessor(ABC):
         """
         pass
     
+    async def aprocess(self, data: PipelineData) -> ProcessorResult:
+        """Process the given data without blocking the event loop.
+        
+        Subclasses can override this with natively asynchronous I/O. The
+        default implementation runs process in the loop's default executor,
+        not the shared one, so a processor that is itself running on the
+        shared executor cannot starve its own sub-tasks.
+        
+        Args:
+            data: The data to process
+            
+        Returns:
+            ProcessorResult containing the processed data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.process, data)
+    
+    def process_batch(self, items: List[PipelineData]) -> List[ProcessorResult]:
+        """Process a batch of data.
+        
+        Subclasses can override this to amortize per-item overhead across
+        the batch. The default implementation processes items concurrently
+        on a shared executor_cls executor.
+        
+        Args:
+            items: The data to process
+            
+        Returns:
+            List of results, one per item and in the same order
+        """
+        if not items:
+            return []
+        
+        executor = get_shared_executor(self.executor_cls, self.max_workers)
+        futures = [executor.submit(self.process, data) for data in items]
+        
+        results = []
+        for data, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Error processing data: {str(e)}")
+                results.append(self.create_error_result(data, str(e)))
+        
+        return results
+    
     @track_metrics
     def create_result(
         self, 
@@ -90,14 +176,16 @@ class BaseProcessor(ABC):
         Returns:
             ProcessorResult object
         """
-        # Create a copy of the original data
-        new_data = copy.deepcopy(data)
-        
-        # Update content and content_type if provided
-        if content is not None:
-            new_data.content = content
-        
-        new_data.content_type = content_type or self.output_type
+        # Shallow-copy the original data with updated content and content_type.
+        # Metadata is copied one level deep so the result can be annotated
+        # without touching the input; metrics are immutable and shared.
+        new_data = data.model_copy(
+            update={
+                "content": data.content if content is None else content,
+                "content_type": content_type or self.output_type,
+                "metadata": dict(data.metadata),
+            }
+        )
         
         # Create and return result
         return ProcessorResult(
@@ -106,6 +194,26 @@ class BaseProcessor(ABC):
             error_message=error_message,
         )
     
+    def create_error_result(self, data: PipelineData, error_message: str) -> ProcessorResult:
+        """Create a failed ProcessorResult that wraps the original data.
+        
+        Unlike create_result, content and metadata are not copied: a failure
+        carries the input through unchanged. The data itself is a shallow
+        copy, so metrics recorded on the result don't touch the caller's input.
+        
+        Args:
+            data: Original data
+            error_message: Error message describing the failure
+            
+        Returns:
+            ProcessorResult object
+        """
+        return ProcessorResult(
+            data=data.model_copy(),
+            success=False,
+            error_message=error_message,
+        )
+    
     def get_asset(self, input_assets: List[str], **kwargs: Any) -> Any:
         """Get an asset decorator for this processor.
         
@@ -127,29 +235,20 @@ class BaseProcessor(ABC):
         )
         @track_metrics
         def _asset(context: OpExecutionContext, **inputs: List[PipelineData]) -> List[ProcessorResult]:
-            results = []
-            
-            # Process all inputs
+            # Collect the items this processor can handle
+            tasks = []
             for asset_name, data_list in inputs.items():
                 for data in data_list:
                     if self.can_process(data):
-                        try:
-                            context.log.info(f"Processing data from {asset_name} with {self.name}")
-                            result = self.process(data)
-                            results.append(result)
-                        except Exception as e:
-                            context.log.error(f"Error processing data: {str(e)}")
-                            results.append(self.create_result(
-                                data, 
-                                success=False, 
-                                error_message=str(e)
-                            ))
+                        context.log.info(f"Processing data from {asset_name} with {self.name}")
+                        tasks.append(data)
                     else:
                         context.log.warning(
                             f"Processor {self.name} cannot handle data of type {data.content_type}"
                         )
             
-            return results
+            # Process as one batch, keeping results in input order
+            return self.process_batch(tasks)
         
         return _asset
     
@@ -176,19 +275,14 @@ class BaseProcessor(ABC):
                     return self.process(data)
                 except Exception as e:
                     context.log.error(f"Error processing data: {str(e)}")
-                    return self.create_result(
-                        data, 
-                        success=False, 
-                        error_message=str(e)
-                    )
+                    return self.create_error_result(data, str(e))
             else:
                 context.log.warning(
                     f"Processor {self.name} cannot handle data of type {data.content_type}"
                 )
-                return self.create_result(
+                return self.create_error_result(
                     data, 
-                    success=False, 
-                    error_message=f"Cannot handle data of type {data.content_type}"
+                    f"Cannot handle data of type {data.content_type}"
                 )
         
         return _op
\ No newline at end of file
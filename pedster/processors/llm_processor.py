@@ -1,23 +1,37 @@
 """LLM processor using various models via OpenRouter."""
 
+import asyncio
+import functools
 import os
-import time
+import re
 from abc import ABC
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import httpx
+import orjson
+import requests
 from dagster import Config, get_dagster_logger
+from pydantic import ConfigDict
 
 from pedster.processors.base_processor import BaseProcessor
+from pedster.utils.cache import SemanticCache
+from pedster.utils.http import backoff_delay, create_session
 from pedster.utils.metrics import track_metrics
 from pedster.utils.models import ContentType, PipelineData, ProcessorResult
 
 
 logger = get_dagster_logger()
 
+# Rate limiting and transient server errors are retried by the session
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 class LLMConfig(Config):
     """Base configuration for LLM processors."""
     
+    # Build the validator on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+    
     api_base: str = "https://openrouter.ai/api/v1"
     api_key: Optional[str] = None
     model: str
@@ -30,20 +44,70 @@ class LLMConfig(Config):
     timeout: int = 60
     retry_count: int = 3
     retry_delay: int = 5
+    cache_responses: bool = False  # Reuse responses for identical or near-identical prompts
+    cache_size: int = 256
+    cache_threshold: float = 0.95  # Minimum cosine similarity for a near-duplicate hit
+    cache_embedding_model: str = "all-MiniLM-L6-v2"
+    enable_prompt_cache: bool = True  # Mark the system message for provider-side prompt caching
 
 
 class PromptTemplate(Config):
     """Configuration for prompt templates."""
     
+    # Build the validator on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+    
     template: str
     system_message: Optional[str] = None
     input_variables: List[str] = ["content"]
     output_format: str = "markdown"
 
 
+@functools.lru_cache(maxsize=128)
+def _build_llm_config(items: Tuple[Tuple[str, Any], ...]) -> LLMConfig:
+    """Build an LLMConfig, memoized on its settings.
+    
+    Configs are frozen, so processors with the same settings can share one
+    validated instance.
+    
+    Args:
+        items: Sorted (name, value) pairs with lists given as tuples
+        
+    Returns:
+        Validated LLM configuration
+    """
+    return LLMConfig(**dict(items))
+
+
+def _get_llm_config(model_config: Dict[str, Any]) -> LLMConfig:
+    """Get a validated LLMConfig for the given settings.
+    
+    Args:
+        model_config: Configuration dictionary including the model
+        
+    Returns:
+        Validated LLM configuration
+    """
+    items = tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in model_config.items()
+    ))
+    try:
+        return _build_llm_config(items)
+    except TypeError:
+        # Unhashable settings cannot be memoized
+        return LLMConfig(**model_config)
+
+
 class LLMProcessor(BaseProcessor, ABC):
     """Base processor for Large Language Models."""
     
+    # Endpoint path appended to api_base, name used in error messages and
+    # whether calls send the bearer token
+    api_path: str = "/chat/completions"
+    api_name: str = "API"
+    requires_api_key: bool = True
+    
     def __init__(
         self,
         name: str,
@@ -73,15 +137,67 @@ class LLMProcessor(BaseProcessor, ABC):
             model_config.update(config)
         
         # Set up configuration
-        self.config_obj = LLMConfig(**model_config)
+        self.config_obj = _get_llm_config(model_config)
         
-        # Set up prompt template
+        # Set up prompt template; a plain string needs no validation
         if isinstance(prompt_template, str):
-            self.prompt_template = PromptTemplate(template=prompt_template)
+            self.prompt_template = PromptTemplate.model_construct(template=prompt_template)
         else:
             self.prompt_template = prompt_template
+        
+        # Match every "{variable}" placeholder in one pass; unlisted braces
+        # (such as JSON examples in the template) are left untouched
+        self._placeholder_pattern = re.compile(
+            "|".join(
+                re.escape(f"{{{var_name}}}")
+                for var_name in self.prompt_template.input_variables
+            )
+            or r"(?!)"
+        )
+        
+        # The endpoint and the settings part of the payload are fixed per
+        # instance; each call only adds its messages
+        self._api_url = f"{self.config_obj.api_base}{self.api_path}"
+        self._static_payload = self._build_static_payload()
+        self._api_key: Optional[str] = None
+        
+        # Pooled session so repeated calls reuse keep-alive connections; the
+        # adapter retries failed calls with backoff, so retry_count is the
+        # total number of attempts
+        self._session = create_session(
+            total_retries=max(0, self.config_obj.retry_count - 1),
+            backoff_factor=self.config_obj.retry_delay,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=("POST",),
+        )
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://pedster.ai",  # Replace with your site URL
+        })
     
-    def _prepare_messages(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        # Anthropic models only reuse a cached prompt prefix when it is marked
+        # with cache_control; OpenAI models cache stable prefixes automatically
+        self._cache_system_message = (
+            self.config_obj.enable_prompt_cache
+            and self.config_obj.model.startswith("anthropic/")
+        )
+        
+        # Optional semantic response cache
+        self._cache = (
+            SemanticCache(
+                capacity=self.config_obj.cache_size,
+                threshold=self.config_obj.cache_threshold,
+                embedding_model=self.config_obj.cache_embedding_model,
+            )
+            if self.config_obj.cache_responses
+            else None
+        )
+    
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self._session.close()
+    
+    def _prepare_messages(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Prepare chat messages from content and prompt template.
         
         Args:
@@ -96,22 +212,34 @@ class LLMProcessor(BaseProcessor, ABC):
         if metadata:
             variables.update(metadata)
         
-        # Format the prompt with variables
-        prompt = self.prompt_template.template
-        for var_name in self.prompt_template.input_variables:
+        # Format the prompt with variables, leaving unknown placeholders as is
+        def substitute(match: "re.Match[str]") -> str:
+            var_name = match.group(0)[1:-1]
             if var_name in variables:
-                placeholder = f"{{{var_name}}}"
-                prompt = prompt.replace(placeholder, str(variables[var_name]))
+                return str(variables[var_name])
+            return match.group(0)
+        
+        prompt = self._placeholder_pattern.sub(substitute, self.prompt_template.template)
         
         # Prepare messages
         messages = []
         
         # Add system message if provided
         if self.prompt_template.system_message:
-            messages.append({
-                "role": "system",
-                "content": self.prompt_template.system_message
-            })
+            if self._cache_system_message:
+                messages.append({
+                    "role": "system",
+                    "content": [{
+                        "type": "text",
+                        "text": self.prompt_template.system_message,
+                        "cache_control": {"type": "ephemeral"},
+                    }]
+                })
+            else:
+                messages.append({
+                    "role": "system",
+                    "content": self.prompt_template.system_message
+                })
         
         # Add user message
         messages.append({
@@ -121,6 +249,84 @@ class LLMProcessor(BaseProcessor, ABC):
         
         return messages
     
+    def _build_static_payload(self) -> Dict[str, Any]:
+        """Build the request payload fields that do not change between calls.
+        
+        Returns:
+            Payload dictionary without the messages
+        """
+        data = {
+            "model": self.config_obj.model,
+            "temperature": self.config_obj.temperature,
+            "max_tokens": self.config_obj.max_tokens,
+            "top_p": self.config_obj.top_p,
+            "frequency_penalty": self.config_obj.frequency_penalty,
+            "presence_penalty": self.config_obj.presence_penalty,
+        }
+        
+        if self.config_obj.stop:
+            data["stop"] = self.config_obj.stop
+        
+        return data
+    
+    def _build_request(self, messages: List[Dict[str, str]]) -> Tuple[str, Dict[str, Any]]:
+        """Build the API endpoint URL and request payload.
+        
+        Args:
+            messages: List of message dictionaries
+            
+        Returns:
+            Tuple of endpoint URL and JSON payload
+        """
+        data = self._static_payload.copy()
+        data["messages"] = messages
+        return self._api_url, data
+    
+    def _convert_response(self, response: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw API response to the OpenRouter response format.
+        
+        Args:
+            response: Decoded JSON response
+            payload: Request payload the response answers
+            
+        Returns:
+            Response in OpenRouter format
+        """
+        return response
+    
+    def _decode_body(self, body: bytes) -> Dict[str, Any]:
+        """Decode a complete API response body.
+        
+        Args:
+            body: Raw response body
+            
+        Returns:
+            Decoded JSON response
+        """
+        return orjson.loads(body)
+    
+    def _read_response(self, response: requests.Response) -> Dict[str, Any]:
+        """Read and decode a streamed API response.
+        
+        Args:
+            response: Response opened with stream=True
+            
+        Returns:
+            Decoded JSON response
+        """
+        return self._decode_body(response.content)
+    
+    def _api_headers(self) -> Dict[str, str]:
+        """Get the per-provider headers for asynchronous API calls.
+        
+        Returns:
+            Header dictionary
+        """
+        headers = {"HTTP-Referer": "https://pedster.ai"}  # Replace with your site URL
+        if self.requires_api_key:
+            headers["Authorization"] = f"Bearer {self._get_api_key()}"
+        return headers
+    
     @track_metrics
     def _call_openrouter(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
         """Call the OpenRouter API.
@@ -134,48 +340,116 @@ class LLMProcessor(BaseProcessor, ABC):
         Raises:
             Exception: If there's an error calling the API
         """
-        import requests
+        # The bearer token is resolved on first use and kept on the session
+        if self.requires_api_key and "Authorization" not in self._session.headers:
+            self._session.headers["Authorization"] = f"Bearer {self._get_api_key()}"
         
-        headers = {
-            "Authorization": f"Bearer {self._get_api_key()}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://pedster.ai",  # Replace with your site URL
-        }
+        url, data = self._build_request(messages)
         
-        data = {
-            "model": self.config_obj.model,
-            "messages": messages,
-            "temperature": self.config_obj.temperature,
-            "max_tokens": self.config_obj.max_tokens,
-            "top_p": self.config_obj.top_p,
-            "frequency_penalty": self.config_obj.frequency_penalty,
-            "presence_penalty": self.config_obj.presence_penalty,
-        }
+        # Retries with backoff are handled by the session's adapter
+        try:
+            with self._session.post(
+                url,
+                data=orjson.dumps(data),
+                timeout=self.config_obj.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                return self._convert_response(self._read_response(response), data)
+            
+        except requests.RequestException as e:
+            raise Exception(
+                f"Failed to call {self.api_name} after {self.config_obj.retry_count} attempts: {str(e)}"
+            )
+    
+    async def _acall_api(self, messages: List[Dict[str, str]], client: Any) -> Dict[str, Any]:
+        """Call the API asynchronously with an httpx.AsyncClient.
         
-        if self.config_obj.stop:
-            data["stop"] = self.config_obj.stop
+        Retries the same status codes as the synchronous session, on the
+        same backoff schedule (see backoff_delay), while yielding to the
+        event loop.
+        
+        Args:
+            messages: List of message dictionaries
+            client: httpx.AsyncClient used for the request
+            
+        Returns:
+            API response
+            
+        Raises:
+            Exception: If there's an error calling the API
+        """
+        url, data = self._build_request(messages)
+        headers = {"Content-Type": "application/json", **self._api_headers()}
+        body = orjson.dumps(data)
         
-        # Try multiple times with backoff
         for attempt in range(self.config_obj.retry_count):
             try:
-                response = requests.post(
-                    f"{self.config_obj.api_base}/chat/completions",
+                # Waiting for a pooled connection is not part of the timeout,
+                # so requests queued behind a busy pool don't time out
+                response = await client.post(
+                    url,
                     headers=headers,
-                    json=data,
-                    timeout=self.config_obj.timeout,
+                    content=body,
+                    timeout=httpx.Timeout(self.config_obj.timeout, pool=None),
                 )
-                response.raise_for_status()
-                return response.json()
+                if (
+                    response.status_code in RETRY_STATUS_CODES
+                    and attempt < self.config_obj.retry_count - 1
+                ):
+                    logger.warning(f"API call failed (attempt {attempt + 1}): HTTP {response.status_code}")
+                else:
+                    response.raise_for_status()
+                    return self._convert_response(self._decode_body(response.content), data)
                 
-            except requests.RequestException as e:
+            except httpx.TransportError as e:
                 logger.warning(f"API call failed (attempt {attempt + 1}): {str(e)}")
+                if attempt == self.config_obj.retry_count - 1:
+                    raise Exception(
+                        f"Failed to call {self.api_name} after {self.config_obj.retry_count} attempts: {str(e)}"
+                    )
                 
-                if attempt < self.config_obj.retry_count - 1:
-                    delay = self.config_obj.retry_delay * (attempt + 1)
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    raise Exception(f"Failed to call API after {self.config_obj.retry_count} attempts: {str(e)}")
+            except httpx.HTTPStatusError as e:
+                raise Exception(f"Failed to call {self.api_name} after {attempt + 1} attempts: {str(e)}")
+            
+            await asyncio.sleep(backoff_delay(self.config_obj.retry_delay, attempt + 1))
+        
+        raise Exception(f"Failed to call {self.api_name}: no attempts were made")
+    
+    def _lookup_cache(self, messages: List[Dict[str, str]]) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """Look up a cached response for the messages.
+        
+        Args:
+            messages: List of message dictionaries
+            
+        Returns:
+            Tuple of cached response (None on a miss or with caching disabled)
+            and the cache key to pass to _store_cache
+        """
+        if self._cache is None:
+            return None, None
+        
+        prompt_text = "\n".join(f"{msg['role']}: {msg['content']}" for msg in messages)
+        response, embedding = self._cache.lookup(self.config_obj.model, prompt_text)
+        if response is None:
+            return None, (prompt_text, embedding)
+        
+        logger.info(f"Using cached response for {self.config_obj.model}")
+        # No tokens were spent on a cached response
+        return {**response, "usage": {}}, None
+    
+    def _store_cache(self, cache_key: Any, response: Dict[str, Any]) -> None:
+        """Cache a successful response.
+        
+        Args:
+            cache_key: Prompt text and embedding returned by _lookup_cache
+            response: API response in OpenRouter format
+        """
+        if cache_key is None or not response.get("choices"):
+            return
+        
+        prompt_text, embedding = cache_key
+        self._cache.store(self.config_obj.model, prompt_text, response, embedding)
     
     def _get_api_key(self) -> str:
         """Get API key from config or environment.
@@ -186,13 +460,19 @@ class LLMProcessor(BaseProcessor, ABC):
         Raises:
             ValueError: If API key is not found
         """
+        # Resolved once and reused for later calls
+        if self._api_key:
+            return self._api_key
+        
         # Try config first
         if self.config_obj.api_key:
-            return self.config_obj.api_key
+            self._api_key = self.config_obj.api_key
+            return self._api_key
         
         # Try environment variables
         api_key = os.environ.get("OPENROUTER_API_KEY")
         if api_key:
+            self._api_key = api_key
             return api_key
         
         raise ValueError(
@@ -215,38 +495,54 @@ class LLMProcessor(BaseProcessor, ABC):
             messages = self._prepare_messages(data.content, data.metadata)
             logger.info(f"Calling {self.config_obj.model} with {len(messages)} messages")
             
+            # Reuse a cached response for the same or a similar prompt
+            response, cache_key = self._lookup_cache(messages)
+            if response is not None:
+                return self._result_from_response(data, response)
+            
             # Call API
             response = self._call_openrouter(messages)
+            self._store_cache(cache_key, response)
             
-            # Extract content
-            if "choices" in response and len(response["choices"]) > 0:
-                content = response["choices"][0]["message"]["content"]
+            return self._result_from_response(data, response)
                 
-                # Extract metrics
-                usage = response.get("usage", {})
-                tokens_in = usage.get("prompt_tokens", 0)
-                tokens_out = usage.get("completion_tokens", 0)
-                
-                # Update metrics in data
-                data_copy = data.model_copy(deep=True)
-                data_copy.metrics.tokens_in = tokens_in
-                data_copy.metrics.tokens_out = tokens_out
-                
-                # Add model info to metadata
-                data_copy.metadata["model"] = self.config_obj.model
-                data_copy.metadata["model_provider"] = response.get("model", "").split("/")[0]
-                
-                return self.create_result(
-                    data_copy,
-                    content=content,
-                )
+        except Exception as e:
+            logger.error(f"Error calling LLM: {str(e)}")
+            return self.create_result(
+                data,
+                success=False,
+                error_message=f"LLM error: {str(e)}",
+            )
+    
+    async def aprocess(self, data: PipelineData, client: Optional[Any] = None) -> ProcessorResult:
+        """Process data with the LLM without blocking the event loop.
+        
+        Args:
+            data: The data to process
+            client: Shared httpx.AsyncClient; a temporary one is used if None
+            
+        Returns:
+            ProcessorResult with model output
+        """
+        try:
+            # Prepare messages
+            messages = self._prepare_messages(data.content, data.metadata)
+            logger.info(f"Calling {self.config_obj.model} with {len(messages)} messages")
+            
+            # Reuse a cached response for the same or a similar prompt
+            response, cache_key = self._lookup_cache(messages)
+            if response is not None:
+                return self._result_from_response(data, response)
+            
+            # Call API
+            if client is None:
+                async with httpx.AsyncClient() as own_client:
+                    response = await self._acall_api(messages, own_client)
             else:
-                logger.error(f"Unexpected API response format: {response}")
-                return self.create_result(
-                    data,
-                    success=False,
-                    error_message="Unexpected API response format",
-                )
+                response = await self._acall_api(messages, client)
+            self._store_cache(cache_key, response)
+            
+            return self._result_from_response(data, response)
                 
         except Exception as e:
             logger.error(f"Error calling LLM: {str(e)}")
@@ -255,6 +551,98 @@ class LLMProcessor(BaseProcessor, ABC):
                 success=False,
                 error_message=f"LLM error: {str(e)}",
             )
+    
+    def process_batch(self, items: List[PipelineData]) -> List[ProcessorResult]:
+        """Process a batch of data with concurrent API calls.
+        
+        All requests share one pooled httpx.AsyncClient on a single event
+        loop, so connections and their handshakes are reused across the
+        batch without a thread per request. When called from a running
+        event loop, where asyncio.run is not allowed, items are processed
+        on the shared executor instead.
+        
+        Args:
+            items: The data to process
+            
+        Returns:
+            List of results, one per item and in the same order
+        """
+        if not items:
+            return []
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._aprocess_batch(items))
+        
+        logger.debug("Event loop already running, processing batch on the shared executor")
+        return super().process_batch(items)
+    
+    async def _aprocess_batch(self, items: List[PipelineData]) -> List[ProcessorResult]:
+        """Process a batch of data concurrently on the running event loop.
+        
+        At most max_workers items are in flight at once, one per pooled
+        connection; the rest wait before sending their request.
+        
+        Args:
+            items: The data to process
+            
+        Returns:
+            List of results, one per item and in the same order
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def process_one(data: PipelineData, client: httpx.AsyncClient) -> ProcessorResult:
+            async with semaphore:
+                return await self.aprocess(data, client=client)
+        
+        limits = httpx.Limits(max_connections=self.max_workers)
+        async with httpx.AsyncClient(limits=limits) as client:
+            return list(await asyncio.gather(*[process_one(data, client) for data in items]))
+    
+    def _result_from_response(self, data: PipelineData, response: Dict[str, Any]) -> ProcessorResult:
+        """Build a processor result from an API response.
+        
+        Args:
+            data: The processed data
+            response: API response in OpenRouter format
+            
+        Returns:
+            ProcessorResult with model output
+        """
+        # Extract content
+        if "choices" in response and len(response["choices"]) > 0:
+            content = response["choices"][0]["message"]["content"]
+            
+            # Extract metrics
+            usage = response.get("usage", {})
+            tokens_in = usage.get("prompt_tokens", 0)
+            tokens_out = usage.get("completion_tokens", 0)
+            
+            # create_result already gives the result its own metadata, so it
+            # is annotated in place without copying data
+            result = self.create_result(
+                data,
+                content=content,
+            )
+            
+            # Update metrics in data
+            result.data.metrics = result.data.metrics.model_copy(
+                update={"tokens_in": tokens_in, "tokens_out": tokens_out}
+            )
+            
+            # Add model info to metadata
+            result.data.metadata["model"] = self.config_obj.model
+            result.data.metadata["model_provider"] = response.get("model", "").split("/")[0]
+            
+            return result
+        else:
+            logger.error(f"Unexpected API response format: {response}")
+            return self.create_result(
+                data,
+                success=False,
+                error_message="Unexpected API response format",
+            )
 
 
 class GPT4OProcessor(LLMProcessor):
@@ -326,6 +714,10 @@ class Claude37Processor(LLMProcessor):
 class OllamaDeepeekProcessor(LLMProcessor):
     """Processor for Ollama DeepSeek model."""
     
+    api_path = "/generate"
+    api_name = "Ollama API"
+    requires_api_key = False
+    
     def __init__(
         self,
         name: str = "deepseek",
@@ -365,81 +757,120 @@ class OllamaDeepeekProcessor(LLMProcessor):
             config=ollama_config,
         )
     
-    @track_metrics
-    def _call_openrouter(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Call the Ollama API instead of OpenRouter.
+    def _build_static_payload(self) -> Dict[str, Any]:
+        """Build the Ollama payload fields that do not change between calls.
+        
+        Returns:
+            Payload dictionary without the prompt
+        """
+        return {
+            "model": self.config_obj.model,
+            "stream": True,
+            "temperature": self.config_obj.temperature,
+            "num_predict": self.config_obj.max_tokens,
+        }
+    
+    def _build_request(self, messages: List[Dict[str, str]]) -> Tuple[str, Dict[str, Any]]:
+        """Build the Ollama generate URL and request payload.
         
         Args:
             messages: List of message dictionaries
             
         Returns:
-            API response in a format compatible with OpenRouter
+            Tuple of endpoint URL and JSON payload
+        """
+        # Convert to Ollama format
+        data = self._static_payload.copy()
+        data["prompt"] = "\n".join(msg["content"] for msg in messages)
+        return self._api_url, data
+    
+    def _merge_stream(self, lines: Iterable[Union[bytes, str]]) -> Dict[str, Any]:
+        """Merge streamed Ollama chunks into a single response.
+        
+        Args:
+            lines: Newline-delimited JSON chunks
+            
+        Returns:
+            Final chunk with the full generated text under "response"
             
         Raises:
-            Exception: If there's an error calling the API
+            Exception: If Ollama reports an error in the stream
         """
-        import requests
+        parts = []
+        final: Dict[str, Any] = {}
+        for line in lines:
+            if not line:
+                continue
+            
+            chunk = orjson.loads(line)
+            if "error" in chunk:
+                raise Exception(f"Ollama error: {chunk['error']}")
+            
+            parts.append(chunk.get("response", ""))
+            if chunk.get("done"):
+                final = chunk
         
-        headers = {
-            "Content-Type": "application/json",
-        }
+        final["response"] = "".join(parts)
+        return final
+    
+    def _read_response(self, response: requests.Response) -> Dict[str, Any]:
+        """Merge an Ollama response stream as its chunks arrive.
         
-        # Convert to Ollama format
-        prompt = "\n".join([msg["content"] for msg in messages])
+        Args:
+            response: Response opened with stream=True
+            
+        Returns:
+            Merged Ollama response
+        """
+        return self._merge_stream(response.iter_lines())
+    
+    def _decode_body(self, body: bytes) -> Dict[str, Any]:
+        """Decode a complete streamed Ollama response body.
         
-        data = {
-            "model": self.config_obj.model,
-            "prompt": prompt,
-            "stream": False,
-            "temperature": self.config_obj.temperature,
-            "num_predict": self.config_obj.max_tokens,
-        }
+        Args:
+            body: Raw newline-delimited JSON body
+            
+        Returns:
+            Merged Ollama response
+        """
+        return self._merge_stream(body.splitlines())
+    
+    def _convert_response(self, response: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an Ollama response to the OpenRouter response format.
         
-        # Try multiple times with backoff
-        for attempt in range(self.config_obj.retry_count):
-            try:
-                response = requests.post(
-                    f"{self.config_obj.api_base}/generate",
-                    headers=headers,
-                    json=data,
-                    timeout=self.config_obj.timeout,
-                )
-                response.raise_for_status()
-                
-                # Convert Ollama response to OpenRouter format
-                ollama_resp = response.json()
-                
-                # Calculate tokens (crude approximation)
-                prompt_len = len(prompt.split())
-                completion_len = len(ollama_resp.get("response", "").split())
-                
-                return {
-                    "choices": [
-                        {
-                            "message": {
-                                "content": ollama_resp.get("response", ""),
-                                "role": "assistant",
-                            },
-                            "finish_reason": "stop",
-                        }
-                    ],
-                    "model": f"ollama/{self.config_obj.model}",
-                    "usage": {
-                        "prompt_tokens": prompt_len,
-                        "completion_tokens": completion_len,
-                        "total_tokens": prompt_len + completion_len,
+        Args:
+            response: Merged Ollama response
+            payload: Request payload the response answers
+            
+        Returns:
+            Response in OpenRouter format
+        """
+        # Ollama reports exact token counts in its final chunk; fall back to
+        # a word count (crude approximation) if they are missing
+        prompt_len = response.get("prompt_eval_count")
+        if prompt_len is None:
+            prompt_len = len(payload["prompt"].split())
+        completion_len = response.get("eval_count")
+        if completion_len is None:
+            completion_len = len(response.get("response", "").split())
+        
+        return {
+            "choices": [
+                {
+                    "message": {
+                        "content": response.get("response", ""),
+                        "role": "assistant",
                     },
+                    "finish_reason": "stop",
                 }
-                
-            except requests.RequestException as e:
-                logger.warning(f"Ollama API call failed (attempt {attempt + 1}): {str(e)}")
-                
-                if attempt < self.config_obj.retry_count - 1:
-                    delay = self.config_obj.retry_delay * (attempt + 1)
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    raise Exception(f"Failed to call Ollama API after {self.config_obj.retry_count} attempts: {str(e)}")
+            ],
+            "model": f"ollama/{self.config_obj.model}",
+            "usage": {
+                "prompt_tokens": prompt_len,
+                "completion_tokens": completion_len,
+                "total_tokens": prompt_len + completion_len,
+            },
+        }
 
 
 class O3MiniProcessor(LLMProcessor):
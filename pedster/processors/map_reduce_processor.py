@@ -1,12 +1,18 @@
 """Map-Reduce processor for parallel processing with multiple models."""
 
+import asyncio
+import hashlib
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
+import httpx
+import orjson
 from dagster import Config, get_dagster_logger
+from pydantic import ConfigDict
 
 from pedster.processors.base_processor import BaseProcessor
+from pedster.processors.llm_processor import LLMProcessor
 from pedster.utils.metrics import track_metrics
 from pedster.utils.models import (ContentType, MapReduceResult, PipelineData,
                                   ProcessorResult)
@@ -18,11 +24,15 @@ logger = get_dagster_logger()
 class MapReduceConfig(Config):
     """Configuration for map-reduce processor."""
     
-    max_workers: int = 3
+    # Build the validator on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+    
+    max_workers: int = 3  # Maximum concurrent API connections
     timeout: int = 120
     combine_results: bool = True
     output_format: str = "markdown"
     parallel: bool = True
+    fail_fast: bool = False  # Stop the remaining processors once one fails
 
 
 class MapReduceProcessor(BaseProcessor):
@@ -85,6 +95,162 @@ class MapReduceProcessor(BaseProcessor):
             )
             return processor.name, error_result
     
+    async def _aprocess_with_processor(
+        self, processor: BaseProcessor, data: PipelineData, client: Optional[Any] = None
+    ) -> Tuple[str, ProcessorResult]:
+        """Process data with a single processor asynchronously.
+        
+        Args:
+            processor: The processor to use
+            data: The data to process
+            client: Shared httpx.AsyncClient for LLM processors
+            
+        Returns:
+            Tuple of processor name and result
+        """
+        try:
+            logger.info(f"Processing with {processor.name}")
+            start_time = time.time()
+            
+            if client is not None and isinstance(processor, LLMProcessor):
+                result = await processor.aprocess(data, client=client)
+            else:
+                result = await processor.aprocess(data)
+            
+            execution_time = (time.time() - start_time) * 1000
+            logger.info(f"{processor.name} completed in {execution_time:.2f}ms")
+            
+            # Coroutines are not timed by track_metrics, so record it here
+            result.metrics = result.metrics.model_copy(update={"execution_time_ms": execution_time})
+            
+            return processor.name, result
+            
+        except Exception as e:
+            logger.error(f"Error in {processor.name}: {str(e)}")
+            # Return error result
+            error_result = processor.create_result(
+                data,
+                success=False,
+                error_message=f"Error in {processor.name}: {str(e)}",
+            )
+            return processor.name, error_result
+    
+    async def _amap(self, data: PipelineData) -> List[Tuple[str, ProcessorResult]]:
+        """Run all processors concurrently on the event loop.
+        
+        LLM processors share one pooled httpx.AsyncClient, so their requests
+        overlap without a thread each; other processors run in the loop's
+        default executor.
+        
+        Args:
+            data: The data to process
+            
+        Returns:
+            List of processor name and result tuples, in processor order
+        """
+        if not any(isinstance(processor, LLMProcessor) for processor in self.processors):
+            return await self._gather(data)
+        
+        limits = httpx.Limits(max_connections=self.config_obj.max_workers)
+        async with httpx.AsyncClient(limits=limits) as client:
+            return await self._gather(data, client)
+    
+    async def _gather(
+        self, data: PipelineData, client: Optional[Any] = None
+    ) -> List[Tuple[str, ProcessorResult]]:
+        """Gather processor results within the timeout.
+        
+        Processors still running when the timeout expires, or when another
+        processor fails with fail_fast set, are cancelled and reported as
+        failed results instead of being dropped.
+        
+        Args:
+            data: The data to process
+            client: Shared httpx.AsyncClient for LLM processors
+            
+        Returns:
+            List of processor name and result tuples, in processor order
+        """
+        # Processors that would send an identical request share one call
+        tasks = []
+        inflight: Dict[bytes, "asyncio.Future[Tuple[str, ProcessorResult]]"] = {}
+        for processor in self.processors:
+            key = self._request_key(processor, data)
+            if key is not None and key in inflight:
+                logger.info(f"{processor.name} shares an identical in-flight request")
+                tasks.append(inflight[key])
+                continue
+            
+            task = asyncio.ensure_future(self._aprocess_with_processor(processor, data, client))
+            if key is not None:
+                inflight[key] = task
+            tasks.append(task)
+        return_when = asyncio.FIRST_COMPLETED if self.config_obj.fail_fast else asyncio.ALL_COMPLETED
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config_obj.timeout
+        pending = set(tasks)
+        failed = False
+        
+        while pending and not failed:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=return_when)
+            failed = self.config_obj.fail_fast and any(not task.result()[1].success for task in done)
+        
+        # Stop whatever is still running
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        results = []
+        claimed = set()
+        for processor, task in zip(self.processors, tasks):
+            if task.cancelled():
+                if failed:
+                    reason = "cancelled after another processor failed"
+                else:
+                    reason = f"timed out after {self.config_obj.timeout}s"
+                logger.warning(f"{processor.name} {reason}")
+                results.append((
+                    processor.name,
+                    processor.create_result(
+                        data,
+                        success=False,
+                        error_message=f"{processor.name} {reason}",
+                    ),
+                ))
+            else:
+                _, result = task.result()
+                if id(task) in claimed:
+                    # Give each processor sharing a call its own annotatable result
+                    result = result.model_copy(
+                        update={"data": result.data.model_copy(update={"metadata": dict(result.data.metadata)})}
+                    )
+                claimed.add(id(task))
+                results.append((processor.name, result))
+        
+        return results
+    
+    def _request_key(self, processor: BaseProcessor, data: PipelineData) -> Optional[bytes]:
+        """Get a digest of the API request a processor would send for the data.
+        
+        Args:
+            processor: The processor to use
+            data: The data to process
+            
+        Returns:
+            Request digest, or None if the processor's calls cannot be shared
+        """
+        if not isinstance(processor, LLMProcessor):
+            return None
+        
+        messages = processor._prepare_messages(data.content, data.metadata)
+        url, payload = processor._build_request(messages)
+        return hashlib.blake2b(orjson.dumps([url, payload]), digest_size=16).digest()
+    
     def _combine_results(self, results: List[ProcessorResult]) -> str:
         """Combine results from multiple processors.
         
@@ -95,7 +261,8 @@ class MapReduceProcessor(BaseProcessor):
             Combined content
         """
         if self.config_obj.output_format == "markdown":
-            combined = "# Combined Results\n\n"
+            # Collect sections and join once instead of growing one string
+            parts = ["# Combined Results\n\n"]
             
             for result in results:
                 processor_name = result.data.metadata.get("processor", "Unknown")
@@ -103,27 +270,30 @@ class MapReduceProcessor(BaseProcessor):
                 
                 # Add section header
                 if model_name:
-                    combined += f"## {processor_name} ({model_name})\n\n"
+                    parts.append(f"## {processor_name} ({model_name})\n\n")
                 else:
-                    combined += f"## {processor_name}\n\n"
+                    parts.append(f"## {processor_name}\n\n")
                 
-                # Add content
-                combined += f"{result.data.content}\n\n"
-                
-                # Add metadata
-                combined += f"*Processed in {result.metrics.execution_time_ms:.2f}ms*\n\n"
-                
-                # Add separator
-                combined += "---\n\n"
+                # Add content, metadata and separator
+                parts.append(
+                    f"{result.data.content}\n\n"
+                    f"*Processed in {result.metrics.execution_time_ms:.2f}ms*\n\n"
+                    "---\n\n"
+                )
             
-            return combined
+            return "".join(parts)
         else:
             # Simple text concatenation
             return "\n\n".join([r.data.content for r in results])
     
     @track_metrics
     def process(self, data: PipelineData) -> ProcessorResult:
-        """Process data with multiple processors in parallel.
+        """Process data with multiple processors.
+        
+        Processors run concurrently on an event loop when parallel is set,
+        and one after another otherwise. Called from a running event loop,
+        where asyncio.run is not allowed, the concurrent run gets its own
+        loop on a worker thread.
         
         Args:
             data: The data to process
@@ -131,55 +301,88 @@ class MapReduceProcessor(BaseProcessor):
         Returns:
             ProcessorResult with combined results
         """
+        if self.config_obj.parallel:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.aprocess(data))
+            
+            logger.debug("Event loop already running, processing on a worker thread")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, self.aprocess(data)).result()
+        
         map_reduce_result = MapReduceResult()
         start_time = time.time()
         
-        # Add input data information to metadata
-        data_copy = data.model_copy(deep=True)
+        # Copy only the mutable metadata; content and metrics are shared
+        data_copy = data.model_copy(update={"metadata": {**data.metadata}})
         
-        if self.config_obj.parallel:
-            # Process in parallel using threads
-            results_dict = {}
-            
-            with ThreadPoolExecutor(max_workers=self.config_obj.max_workers) as executor:
-                futures = {
-                    executor.submit(
-                        self._process_with_processor, processor, data_copy
-                    ): processor.name
-                    for processor in self.processors
-                }
-                
-                for future in as_completed(futures, timeout=self.config_obj.timeout):
-                    processor_name, result = future.result()
-                    results_dict[processor_name] = result
-                    
-                    # Add processor name to metadata
-                    result.data.metadata["processor"] = processor_name
-                    
-                    # Add to results list
-                    map_reduce_result.results.append(result)
-        else:
-            # Process sequentially
-            for processor in self.processors:
-                processor_name, result = self._process_with_processor(processor, data_copy)
-                
-                # Add processor name to metadata
-                result.data.metadata["processor"] = processor_name
-                
-                # Add to results list
-                map_reduce_result.results.append(result)
+        # Process sequentially
+        for processor in self.processors:
+            processor_name, result = self._process_with_processor(processor, data_copy)
+            
+            # Add processor name to metadata
+            result.data.metadata["processor"] = processor_name
+            
+            # Add to results list
+            map_reduce_result.results.append(result)
+            
+            if self.config_obj.fail_fast and not result.success:
+                logger.warning(f"{processor_name} failed, skipping remaining processors")
+                break
+        
+        return self._reduce(map_reduce_result, data_copy, start_time)
+    
+    async def aprocess(self, data: PipelineData) -> ProcessorResult:
+        """Process data with multiple processors concurrently.
+        
+        Args:
+            data: The data to process
+            
+        Returns:
+            ProcessorResult with combined results
+        """
+        map_reduce_result = MapReduceResult()
+        start_time = time.time()
+        
+        # Copy only the mutable metadata; content and metrics are shared
+        data_copy = data.model_copy(update={"metadata": {**data.metadata}})
         
+        for processor_name, result in await self._amap(data_copy):
+            # Add processor name to metadata
+            result.data.metadata["processor"] = processor_name
+            
+            # Add to results list
+            map_reduce_result.results.append(result)
+        
+        return self._reduce(map_reduce_result, data_copy, start_time)
+    
+    def _reduce(
+        self, map_reduce_result: MapReduceResult, data: PipelineData, start_time: float
+    ) -> ProcessorResult:
+        """Reduce the collected processor results to a single result.
+        
+        Args:
+            map_reduce_result: Collected processor results
+            data: The processed data
+            start_time: Time processing started, from time.time()
+            
+        Returns:
+            ProcessorResult with combined results
+        """
         # Combine results if requested
         if self.config_obj.combine_results and map_reduce_result.results:
             combined_content = self._combine_results(map_reduce_result.results)
             map_reduce_result.combined_content = combined_content
             
             # Update execution time
-            map_reduce_result.metrics.execution_time_ms = (time.time() - start_time) * 1000
+            map_reduce_result.metrics = map_reduce_result.metrics.model_copy(
+                update={"execution_time_ms": (time.time() - start_time) * 1000}
+            )
             
             # Return combined result
             return self.create_result(
-                data_copy,
+                data,
                 content=combined_content,
             )
         elif map_reduce_result.results:
@@ -193,7 +396,7 @@ class MapReduceProcessor(BaseProcessor):
         else:
             # No results
             return self.create_result(
-                data_copy,
+                data,
                 success=False,
                 error_message="No results from any processor",
             )
\ No newline at end of file
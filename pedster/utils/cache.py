@@ -0,0 +1,179 @@
+"""Response caching utilities for Pedster."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+from dagster import get_dagster_logger
+
+
+logger = get_dagster_logger()
+
+
+class SemanticCache:
+    """LRU cache that also matches near-duplicate prompts by embedding similarity.
+
+    Entries are keyed by a namespace (such as the model name) and the prompt
+    text. An exact match is returned without embedding anything; otherwise
+    the prompt is embedded and compared against cached prompts in the same
+    namespace by cosine similarity.
+
+    The embedding model truncates its input, so prompts longer than its
+    max_tokens would be compared by their first max_tokens only and could
+    match a different prompt with the same prefix. Such prompts are only
+    matched exactly.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        threshold: float = 0.95,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        embed: Optional[Callable[[str], Any]] = None,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of cached entries
+            threshold: Minimum cosine similarity for a near-duplicate hit
+            embedding_model: sentence-transformers model used for embeddings
+            embed: Optional embedding function, used instead of the model
+            count_tokens: Optional function counting the tokens embed sees,
+                used instead of the model's tokenizer
+            max_tokens: Longest input, in tokens, that embed does not
+                truncate; the model's max_seq_length when embed is not given
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self._embed = embed
+        self._count_tokens = count_tokens
+        self.max_tokens = max_tokens
+
+        # (namespace, text) -> (normalized embedding, value), oldest first;
+        # the embedding is None for prompts that are only matched exactly
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Optional[np.ndarray], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load_model(self) -> None:
+        """Load the embedding model and its tokenizer.
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers not installed. Please install it with: "
+                "pip install sentence-transformers"
+            )
+
+        logger.info(f"Loading embedding model {self.embedding_model}...")
+        model = SentenceTransformer(self.embedding_model)
+        self._embed = model.encode
+        if self._count_tokens is None:
+            tokenizer = model.tokenizer
+            self._count_tokens = lambda text: len(tokenizer(text, verbose=False)["input_ids"])
+        if self.max_tokens is None:
+            self.max_tokens = model.max_seq_length
+
+    def _embeddable(self, text: str) -> bool:
+        """Check whether text fits the embedding model without truncation.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            True if the text can be matched by similarity
+        """
+        if self._embed is None:
+            self._load_model()
+        if self.max_tokens is None or self._count_tokens is None:
+            return True
+        return self._count_tokens(text) <= self.max_tokens
+
+    def _embedding(self, text: str) -> np.ndarray:
+        """Embed text as an L2-normalized vector.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Normalized embedding
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if self._embed is None:
+            self._load_model()
+
+        embedding = np.asarray(self._embed(text), dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else embedding
+
+    def lookup(self, namespace: str, text: str) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+        """Look up a cached value for the text or a near duplicate of it.
+
+        Args:
+            namespace: Namespace the entry must belong to
+            text: Prompt text
+
+        Returns:
+            Tuple of cached value (None on a miss) and the text's embedding,
+            which is None on an exact hit or for text too long to embed and
+            can be passed to store
+        """
+        key = (namespace, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1], None
+
+        if not self._embeddable(text):
+            return None, None
+
+        embedding = self._embedding(text)
+
+        with self._lock:
+            keys = [
+                cached_key for cached_key, (cached_embedding, _) in self._entries.items()
+                if cached_key[0] == namespace and cached_embedding is not None
+            ]
+            if keys:
+                matrix = np.stack([self._entries[cached_key][0] for cached_key in keys])
+                scores = matrix @ embedding
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    self._entries.move_to_end(keys[best])
+                    logger.debug(f"Semantic cache hit with similarity {scores[best]:.3f}")
+                    return self._entries[keys[best]][1], embedding
+
+        return None, embedding
+
+    def store(self, namespace: str, text: str, value: Any, embedding: Optional[np.ndarray] = None) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            namespace: Namespace of the entry
+            text: Prompt text
+            value: Value to cache
+            embedding: Embedding returned by lookup, computed if None and
+                the text fits the embedding model
+        """
+        if embedding is None and self._embeddable(text):
+            embedding = self._embedding(text)
+
+        with self._lock:
+            self._entries[(namespace, text)] = (embedding, value)
+            self._entries.move_to_end((namespace, text))
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
@@ -1,45 +1,152 @@
 """Database models and utilities for Pedster."""
 
 import os
-import json
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from functools import cached_property, lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterable, Type, Union
 
+import numpy as np
+import orjson
 from sqlalchemy import (
-    create_engine, Column, Integer, String, 
-    Text, DateTime, Boolean, Float, ForeignKey, JSON
+    bindparam, case, column, create_engine, event, func, inspect, insert, select, table, text, update, Float, Index, String, 
+    Text, ForeignKey
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker, Session
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker, Session
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for Pedster models."""
+
+
+def pack_embedding(vector: Optional[Any]) -> Optional[bytes]:
+    """Pack an embedding vector into a float32 blob for storage.
+    
+    Args:
+        vector: Sequence or array of floats, or None
+        
+    Returns:
+        Packed bytes, or None
+    """
+    if vector is None:
+        return None
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def unpack_embedding(value: Optional[Union[bytes, str]]) -> Optional[np.ndarray]:
+    """Unpack a stored embedding into a float32 array.
+    
+    Args:
+        value: Packed float32 bytes, or a JSON list written by older versions
+        
+    Returns:
+        Embedding array, or None
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return np.asarray(orjson.loads(value), dtype=np.float32)
+    return np.frombuffer(value, dtype=np.float32)
+
+
+# PipelineData metadata keys, in the order to_pipeline_data fills them
+ARTICLE_METADATA_KEYS = (
+    "title", "url", "author", "feed_id", "feed_title", "description", "word_count",
+    "summary", "quality_tier", "quality_score", "labels", "original_id", "guid",
+)
+EPISODE_METADATA_KEYS = (
+    "title", "podcast_title", "podcast_author", "description", "audio_url",
+    "transcript_source", "podcast_id", "original_id", "guid", "summary",
+    "quality_tier", "quality_score",
+)
+MESSAGE_METADATA_KEYS = (
+    "from_me", "sender", "thread_id", "thread_name", "is_group", "original_id", "message_id",
+)
+
+# Feed column holding the article count for each quality tier
+QUALITY_TIER_COLUMNS = {"S": "qc_s", "A": "qc_a", "B": "qc_b", "C": "qc_c", "D": "qc_d"}
 
 
 class Feed(Base):
     """Model for RSS feed subscriptions."""
     __tablename__ = "feeds"
 
-    id = Column(Integer, primary_key=True)
-    title = Column(String(255), nullable=False)
-    url = Column(String(512), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
-    website_url = Column(String(512), nullable=True)
-    last_updated = Column(DateTime, default=datetime.utcnow)
-    last_checked = Column(DateTime, default=datetime.utcnow)
-    muted = Column(Boolean, default=False)
-    muted_reason = Column(Text, nullable=True)  # Reason for muting the feed
-    peer_through = Column(Boolean, default=False)  # Whether to peer through aggregator to origin article
-    error_count = Column(Integer, default=0)  # Count of consecutive errors
-    no_entries_count = Column(Integer, default=0)  # Count of consecutive checks with no entries
-    last_error = Column(Text, nullable=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(255))
+    url: Mapped[str] = mapped_column(String(512), unique=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    website_url: Mapped[Optional[str]] = mapped_column(String(512))
+    last_updated: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    last_checked: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    muted: Mapped[Optional[bool]] = mapped_column(default=False)
+    muted_reason: Mapped[Optional[str]] = mapped_column(Text)  # Reason for muting the feed
+    peer_through: Mapped[Optional[bool]] = mapped_column(default=False)  # Whether to peer through aggregator to origin article
+    error_count: Mapped[Optional[int]] = mapped_column(default=0)  # Count of consecutive errors
+    no_entries_count: Mapped[Optional[int]] = mapped_column(default=0)  # Count of consecutive checks with no entries
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
     
     # Statistics
-    article_count = Column(Integer, default=0)  # Total count of ingested articles
-    avg_quality_score = Column(Float, nullable=True)  # Average quality score of articles
-    quality_tier_counts = Column(Text, nullable=True)  # JSON string of quality tier counts {"S": 5, "A": 10, ...}
+    article_count: Mapped[Optional[int]] = mapped_column(default=0)  # Total count of ingested articles
+    avg_quality_score: Mapped[Optional[float]] = mapped_column(Float)  # Average quality score of articles
+    # Article counts per quality tier, one column per tier
+    qc_s: Mapped[int] = mapped_column(default=0, server_default="0")
+    qc_a: Mapped[int] = mapped_column(default=0, server_default="0")
+    qc_b: Mapped[int] = mapped_column(default=0, server_default="0")
+    qc_c: Mapped[int] = mapped_column(default=0, server_default="0")
+    qc_d: Mapped[int] = mapped_column(default=0, server_default="0")
     
-    # Relationships
-    articles = relationship("Article", back_populates="feed", cascade="all, delete-orphan")
+    # Relationships are never lazy loaded; queries that need them must load
+    # them eagerly (selectinload/joinedload) to avoid a query per row
+    articles: Mapped[List["Article"]] = relationship(back_populates="feed", cascade="all, delete-orphan", lazy="raise")
+
+    @property
+    def quality_tier_counts(self) -> Dict[str, int]:
+        """Get article counts per quality tier, e.g. {"S": 5, "A": 10, ...}."""
+        return {tier: getattr(self, column) or 0 for tier, column in QUALITY_TIER_COLUMNS.items()}
+
+    @classmethod
+    def refresh_stats(cls, session: Session) -> int:
+        """Recompute article statistics for all feeds in a single UPDATE.
+        
+        Aggregates article count, average quality score and quality tier
+        counts per feed in the database. Feeds without articles are left
+        unchanged.
+        
+        Args:
+            session: Database session
+            
+        Returns:
+            Number of feeds updated
+        """
+        stats = (
+            select(
+                Article.feed_id,
+                func.count().label("article_count"),
+                func.avg(Article.quality_score).label("avg_quality_score"),
+                *(
+                    func.sum(case((Article.quality_tier == tier, 1), else_=0)).label(column_name)
+                    for tier, column_name in QUALITY_TIER_COLUMNS.items()
+                ),
+            )
+            .group_by(Article.feed_id)
+            .subquery()
+        )
+        
+        columns = ["article_count", "avg_quality_score", *QUALITY_TIER_COLUMNS.values()]
+        result = session.execute(
+            update(cls)
+            .where(cls.id == stats.c.feed_id)
+            .values({name: stats.c[name] for name in columns})
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
+
+    @cached_property
+    def pipeline_source(self) -> str:
+        """Get the PipelineData source for this feed's articles."""
+        return f"rss:{self.title}"
 
     def __repr__(self) -> str:
         return f"<Feed(id={self.id}, title='{self.title}', muted={self.muted})>"
@@ -48,30 +155,62 @@ class Feed(Base):
 class Article(Base):
     """Model for articles from RSS feeds."""
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_feed_fetched", "feed_id", "fetched_at"),
+        # Partial index over the unprocessed queue; match it with processed = 0
+        Index("ix_articles_unprocessed", "feed_id", sqlite_where=text("processed = 0")),
+        Index("ix_articles_quality_tier", "quality_tier"),
+    )
 
-    id = Column(Integer, primary_key=True)
-    feed_id = Column(Integer, ForeignKey("feeds.id"), nullable=False)
-    title = Column(String(512), nullable=False)
-    url = Column(String(512), nullable=False)
-    guid = Column(String(512), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
-    content = Column(Text, nullable=True)
-    author = Column(String(255), nullable=True)
-    published_at = Column(DateTime, nullable=True)
-    fetched_at = Column(DateTime, default=datetime.utcnow)
-    processed = Column(Boolean, default=False)
-    processed_at = Column(DateTime, nullable=True)
-    summary = Column(Text, nullable=True)
-    quality_tier = Column(String(1), nullable=True)  # S, A, B, C, D
-    quality_score = Column(Integer, nullable=True)  # 1-100
-    labels = Column(String(255), nullable=True)
-    embedding_generated = Column(Boolean, default=False)
-    embedding = Column(Text, nullable=True)  # JSON string of vector embedding
-    word_count = Column(Integer, nullable=True)
-    jina_enhanced = Column(Boolean, default=False)  # Flag to indicate if content was fetched from Jina.ai
+    id: Mapped[int] = mapped_column(primary_key=True)
+    feed_id: Mapped[int] = mapped_column(ForeignKey("feeds.id"))
+    title: Mapped[str] = mapped_column(String(512))
+    url: Mapped[str] = mapped_column(String(512))
+    guid: Mapped[str] = mapped_column(String(512), unique=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    # Large columns are deferred: loaded on first access, or up front with
+    # options(undefer_group("body")) / undefer_group("embedding")
+    content: Mapped[Optional[str]] = mapped_column(Text, deferred=True, deferred_group="body")
+    author: Mapped[Optional[str]] = mapped_column(String(255))
+    published_at: Mapped[Optional[datetime]] = mapped_column()
+    fetched_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    processed: Mapped[Optional[bool]] = mapped_column(default=False)
+    processed_at: Mapped[Optional[datetime]] = mapped_column()
+    summary: Mapped[Optional[str]] = mapped_column(Text)
+    quality_tier: Mapped[Optional[str]] = mapped_column(String(1))  # S, A, B, C, D
+    quality_score: Mapped[Optional[int]] = mapped_column()  # 1-100
+    labels: Mapped[Optional[str]] = mapped_column(String(255))
+    embedding_generated: Mapped[Optional[bool]] = mapped_column(default=False)
+    embedding: Mapped[Optional[bytes]] = mapped_column(deferred=True, deferred_group="embedding")  # Packed float32 vector embedding
+    word_count: Mapped[Optional[int]] = mapped_column()
+    jina_enhanced: Mapped[Optional[bool]] = mapped_column(default=False)  # Flag to indicate if content was fetched from Jina.ai
     
     # Relationships
-    feed = relationship("Feed", back_populates="articles")
+    feed: Mapped["Feed"] = relationship(back_populates="articles", lazy="raise")
+
+    @property
+    def embedding_vec(self) -> Optional[np.ndarray]:
+        """Get the embedding as a float32 array."""
+        return unpack_embedding(self.embedding)
+
+    @embedding_vec.setter
+    def embedding_vec(self, vector: Optional[Any]) -> None:
+        """Store an embedding vector as a packed float32 blob."""
+        self.embedding = pack_embedding(vector)
+
+    @classmethod
+    def search(cls, session: Session, query: str, limit: Optional[int] = None) -> List["Article"]:
+        """Find articles whose title, content or summary match a full-text query.
+        
+        Args:
+            session: Database session
+            query: FTS5 query, e.g. ``"vector database" OR sqlite``
+            limit: Maximum number of articles to return
+            
+        Returns:
+            Matching articles, best match first
+        """
+        return _fts_search(session, cls, "articles_fts", query, limit)
 
     def __repr__(self) -> str:
         return f"<Article(id={self.id}, title='{self.title[:30]}...', quality_tier='{self.quality_tier or 'None'}')>"
@@ -80,44 +219,80 @@ class Article(Base):
         """Convert to PipelineData format for processing."""
         from pedster.utils.models import ContentType, PipelineData
         
+        feed = self.feed
         return PipelineData(
             id=str(self.id),
             content=self.content,
             content_type=ContentType.TEXT,
-            source=f"rss:{self.feed.title}",
+            source=feed.pipeline_source,
             timestamp=self.published_at or self.fetched_at,
-            metadata={
-                "title": self.title,
-                "url": self.url,
-                "author": self.author,
-                "feed_id": self.feed_id,
-                "feed_title": self.feed.title,
-                "description": self.description,
-                "word_count": self.word_count,
-                "summary": self.summary,
-                "quality_tier": self.quality_tier,
-                "quality_score": self.quality_score,
-                "labels": self.labels,
-                "original_id": self.id,
-                "guid": self.guid,
-            }
+            metadata=dict(zip(ARTICLE_METADATA_KEYS, (
+                self.title, self.url, self.author, self.feed_id, feed.title, self.description,
+                self.word_count, self.summary, self.quality_tier, self.quality_score,
+                self.labels, self.id, self.guid,
+            ))),
         )
 
+    @classmethod
+    def bulk_to_pipeline_data(cls, session: Session, *criteria: Any) -> List[Any]:
+        """Convert matching articles to PipelineData with a single query.
+        
+        Selects only the needed columns joined with their feed, and builds
+        PipelineData with bulk_new, without re-validating values that came
+        from the database.
+        
+        Args:
+            session: Database session
+            *criteria: Filter expressions, e.g. ``Article.feed_id == 1``
+            
+        Returns:
+            List of PipelineData, one per matching article
+        """
+        from pedster.utils.models import ContentType, PipelineData
+        
+        # Metadata columns follow ARTICLE_METADATA_KEYS after the first three
+        rows = session.execute(
+            select(
+                cls.content, cls.published_at, cls.fetched_at,
+                cls.title, cls.url, cls.author, cls.feed_id, Feed.title, cls.description,
+                cls.word_count, cls.summary, cls.quality_tier, cls.quality_score,
+                cls.labels, cls.id, cls.guid,
+            ).join(Feed, cls.feed_id == Feed.id).where(*criteria)
+        ).all()
+        
+        sources: Dict[str, str] = {}
+        # Loop constants are bound to locals once
+        text_type = ContentType.TEXT
+        values = []
+        for row in rows:
+            metadata = dict(zip(ARTICLE_METADATA_KEYS, row[3:]))
+            feed_title = metadata["feed_title"]
+            source = sources.get(feed_title)
+            if source is None:
+                source = sources[feed_title] = f"rss:{feed_title}"
+            values.append((str(metadata["original_id"]), row[0], text_type, source, row[1] or row[2], metadata))
+        return PipelineData.bulk_new(values)
+
 
 class Podcast(Base):
     """Model for podcast feeds."""
     __tablename__ = "podcasts"
     
-    id = Column(Integer, primary_key=True)
-    title = Column(String(255), nullable=False)
-    author = Column(String(255))
-    feed_url = Column(String(512), unique=True, nullable=False)
-    muted = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(255))
+    author: Mapped[Optional[str]] = mapped_column(String(255))
+    feed_url: Mapped[str] = mapped_column(String(512), unique=True)
+    muted: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    episodes = relationship("Episode", back_populates="podcast")
+    episodes: Mapped[List["Episode"]] = relationship(back_populates="podcast", lazy="raise")
+
+    @cached_property
+    def pipeline_source(self) -> str:
+        """Get the PipelineData source for this podcast's episodes."""
+        return f"podcast:{self.title}"
 
     def __repr__(self) -> str:
         return f"<Podcast(id={self.id}, title='{self.title}', muted={self.muted})>"
@@ -126,27 +301,56 @@ class Podcast(Base):
 class Episode(Base):
     """Model for podcast episodes."""
     __tablename__ = "episodes"
+    __table_args__ = (
+        Index("ix_episodes_podcast_published", "podcast_id", "published_at"),
+        Index("ix_episodes_unprocessed", "podcast_id", sqlite_where=text("processed = 0")),
+    )
     
-    id = Column(Integer, primary_key=True)
-    podcast_id = Column(Integer, ForeignKey("podcasts.id"))
-    guid = Column(String(512), unique=True, nullable=False)
-    title = Column(String(255), nullable=False)
-    description = Column(Text)
-    published_at = Column(DateTime)
-    audio_url = Column(String(512))
-    transcript = Column(Text)
-    transcript_source = Column(String(50))  # Source of transcript: 'whisper', 'external', etc.
-    transcript_url = Column(String(512))  # URL to external transcript if available
-    embedding = Column(Text)  # JSON string of vector embedding
-    summary = Column(Text)  # AI-generated summary
-    quality_tier = Column(String(1), nullable=True)  # S, A, B, C, D
-    quality_score = Column(Integer, nullable=True)  # 1-100
-    processed = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    processed_at = Column(DateTime, nullable=True)  # When the episode was processed
+    id: Mapped[int] = mapped_column(primary_key=True)
+    podcast_id: Mapped[Optional[int]] = mapped_column(ForeignKey("podcasts.id"))
+    guid: Mapped[str] = mapped_column(String(512), unique=True)
+    title: Mapped[str] = mapped_column(String(255))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    published_at: Mapped[Optional[datetime]] = mapped_column()
+    audio_url: Mapped[Optional[str]] = mapped_column(String(512))
+    # Large columns are deferred, see Article
+    transcript: Mapped[Optional[str]] = mapped_column(Text, deferred=True, deferred_group="body")
+    transcript_source: Mapped[Optional[str]] = mapped_column(String(50))  # Source of transcript: 'whisper', 'external', etc.
+    transcript_url: Mapped[Optional[str]] = mapped_column(String(512))  # URL to external transcript if available
+    embedding: Mapped[Optional[bytes]] = mapped_column(deferred=True, deferred_group="embedding")  # Packed float32 vector embedding
+    summary: Mapped[Optional[str]] = mapped_column(Text)  # AI-generated summary
+    quality_tier: Mapped[Optional[str]] = mapped_column(String(1))  # S, A, B, C, D
+    quality_score: Mapped[Optional[int]] = mapped_column()  # 1-100
+    processed: Mapped[Optional[bool]] = mapped_column(default=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    processed_at: Mapped[Optional[datetime]] = mapped_column()  # When the episode was processed
     
     # Relationships
-    podcast = relationship("Podcast", back_populates="episodes")
+    podcast: Mapped[Optional["Podcast"]] = relationship(back_populates="episodes", lazy="raise")
+
+    @property
+    def embedding_vec(self) -> Optional[np.ndarray]:
+        """Get the embedding as a float32 array."""
+        return unpack_embedding(self.embedding)
+
+    @embedding_vec.setter
+    def embedding_vec(self, vector: Optional[Any]) -> None:
+        """Store an embedding vector as a packed float32 blob."""
+        self.embedding = pack_embedding(vector)
+
+    @classmethod
+    def search(cls, session: Session, query: str, limit: Optional[int] = None) -> List["Episode"]:
+        """Find episodes whose title, description or transcript match a full-text query.
+        
+        Args:
+            session: Database session
+            query: FTS5 query, e.g. ``"vector database" OR sqlite``
+            limit: Maximum number of episodes to return
+            
+        Returns:
+            Matching episodes, best match first
+        """
+        return _fts_search(session, cls, "episodes_fts", query, limit)
 
     def __repr__(self) -> str:
         return f"<Episode(id={self.id}, title='{self.title[:30]}...', processed={self.processed})>"
@@ -155,41 +359,82 @@ class Episode(Base):
         """Convert to PipelineData format for processing."""
         from pedster.utils.models import ContentType, PipelineData
         
+        podcast = self.podcast
         return PipelineData(
             id=str(self.id),
             content=self.transcript or self.description,
             content_type=ContentType.TEXT if self.transcript else ContentType.AUDIO,
-            source=f"podcast:{self.podcast.title}",
+            source=podcast.pipeline_source,
             timestamp=self.published_at or self.created_at,
-            metadata={
-                "title": self.title,
-                "podcast_title": self.podcast.title,
-                "podcast_author": self.podcast.author,
-                "description": self.description,
-                "audio_url": self.audio_url,
-                "transcript_source": self.transcript_source,
-                "podcast_id": self.podcast_id,
-                "original_id": self.id,
-                "guid": self.guid,
-                "summary": self.summary,
-                "quality_tier": self.quality_tier,
-                "quality_score": self.quality_score,
-            }
+            metadata=dict(zip(EPISODE_METADATA_KEYS, (
+                self.title, podcast.title, podcast.author, self.description, self.audio_url,
+                self.transcript_source, self.podcast_id, self.id, self.guid, self.summary,
+                self.quality_tier, self.quality_score,
+            ))),
         )
 
+    @classmethod
+    def bulk_to_pipeline_data(cls, session: Session, *criteria: Any) -> List[Any]:
+        """Convert matching episodes to PipelineData with a single query.
+        
+        Args:
+            session: Database session
+            *criteria: Filter expressions, e.g. ``Episode.podcast_id == 1``
+            
+        Returns:
+            List of PipelineData, one per matching episode
+        """
+        from pedster.utils.models import ContentType, PipelineData
+        
+        # Metadata columns follow EPISODE_METADATA_KEYS after the first three
+        rows = session.execute(
+            select(
+                cls.transcript, cls.published_at, cls.created_at,
+                cls.title, Podcast.title, Podcast.author, cls.description, cls.audio_url,
+                cls.transcript_source, cls.podcast_id, cls.id, cls.guid, cls.summary,
+                cls.quality_tier, cls.quality_score,
+            ).join(Podcast, cls.podcast_id == Podcast.id).where(*criteria)
+        ).all()
+        
+        sources: Dict[str, str] = {}
+        # Loop constants are bound to locals once
+        text_type, audio_type = ContentType.TEXT, ContentType.AUDIO
+        values = []
+        for row in rows:
+            metadata = dict(zip(EPISODE_METADATA_KEYS, row[3:]))
+            podcast_title = metadata["podcast_title"]
+            source = sources.get(podcast_title)
+            if source is None:
+                source = sources[podcast_title] = f"podcast:{podcast_title}"
+            transcript = row[0]
+            values.append((
+                str(metadata["original_id"]),
+                transcript or metadata["description"],
+                text_type if transcript else audio_type,
+                source,
+                row[1] or row[2],
+                metadata,
+            ))
+        return PipelineData.bulk_new(values)
+
 
 class MessageThread(Base):
     """Model for iMessage message threads."""
     __tablename__ = "message_threads"
     
-    id = Column(Integer, primary_key=True)
-    thread_id = Column(String(255), unique=True, nullable=False)
-    name = Column(String(255))
-    is_group = Column(Boolean, default=False)
-    last_processed = Column(DateTime, default=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    thread_id: Mapped[str] = mapped_column(String(255), unique=True)
+    name: Mapped[Optional[str]] = mapped_column(String(255))
+    is_group: Mapped[Optional[bool]] = mapped_column(default=False)
+    last_processed: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
     
     # Relationships
-    messages = relationship("Message", back_populates="thread", cascade="all, delete-orphan")
+    messages: Mapped[List["Message"]] = relationship(back_populates="thread", cascade="all, delete-orphan", lazy="raise")
+
+    @cached_property
+    def pipeline_source(self) -> str:
+        """Get the PipelineData source for this thread's messages."""
+        return f"imessage:{self.name or self.thread_id}"
 
     def __repr__(self) -> str:
         return f"<MessageThread(id={self.id}, name='{self.name}', is_group={self.is_group})>"
@@ -198,19 +443,22 @@ class MessageThread(Base):
 class Message(Base):
     """Model for iMessage messages."""
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_thread_date", "thread_id", "date"),
+    )
     
-    id = Column(Integer, primary_key=True)
-    thread_id = Column(Integer, ForeignKey("message_threads.id"), nullable=False)
-    message_id = Column(String(255), unique=True, nullable=False)
-    text = Column(Text)
-    from_me = Column(Boolean, default=False)
-    sender = Column(String(255))
-    date = Column(DateTime, nullable=False)
-    processed = Column(Boolean, default=False)
-    processed_at = Column(DateTime)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    thread_id: Mapped[int] = mapped_column(ForeignKey("message_threads.id"))
+    message_id: Mapped[str] = mapped_column(String(255), unique=True)
+    text: Mapped[Optional[str]] = mapped_column(Text)
+    from_me: Mapped[Optional[bool]] = mapped_column(default=False)
+    sender: Mapped[Optional[str]] = mapped_column(String(255))
+    date: Mapped[datetime] = mapped_column()
+    processed: Mapped[Optional[bool]] = mapped_column(default=False)
+    processed_at: Mapped[Optional[datetime]] = mapped_column()
     
     # Relationships
-    thread = relationship("MessageThread", back_populates="messages")
+    thread: Mapped["MessageThread"] = relationship(back_populates="messages", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, from={'me' if self.from_me else self.sender}, date={self.date})>"
@@ -219,33 +467,245 @@ class Message(Base):
         """Convert to PipelineData format for processing."""
         from pedster.utils.models import ContentType, PipelineData
         
+        thread = self.thread
         return PipelineData(
             id=str(self.id),
             content=self.text,
             content_type=ContentType.TEXT,
-            source=f"imessage:{self.thread.name or self.thread.thread_id}",
+            source=thread.pipeline_source,
             timestamp=self.date,
-            metadata={
-                "from_me": self.from_me,
-                "sender": self.sender,
-                "thread_id": self.thread.thread_id,
-                "thread_name": self.thread.name,
-                "is_group": self.thread.is_group,
-                "original_id": self.id,
-                "message_id": self.message_id,
-            }
+            metadata=dict(zip(MESSAGE_METADATA_KEYS, (
+                self.from_me, self.sender, thread.thread_id, thread.name,
+                thread.is_group, self.id, self.message_id,
+            ))),
+        )
+
+    @classmethod
+    def bulk_to_pipeline_data(cls, session: Session, *criteria: Any) -> List[Any]:
+        """Convert matching messages to PipelineData with a single query.
+        
+        Args:
+            session: Database session
+            *criteria: Filter expressions, e.g. ``Message.processed == False``
+            
+        Returns:
+            List of PipelineData, one per matching message
+        """
+        from pedster.utils.models import ContentType, PipelineData
+        
+        # Metadata columns follow MESSAGE_METADATA_KEYS after the first two
+        rows = session.execute(
+            select(
+                cls.text, cls.date,
+                cls.from_me, cls.sender, MessageThread.thread_id, MessageThread.name,
+                MessageThread.is_group, cls.id, cls.message_id,
+            ).join(MessageThread, cls.thread_id == MessageThread.id).where(*criteria)
+        ).all()
+        
+        text_type = ContentType.TEXT
+        return PipelineData.bulk_new(
+            (
+                str(row[7]),
+                row[0],
+                text_type,
+                f"imessage:{row[5] or row[4]}",
+                row[1],
+                dict(zip(MESSAGE_METADATA_KEYS, row[2:])),
+            )
+            for row in rows
         )
 
 
+def bulk_insert(session: Session, model: Type[Any], rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+    """Insert rows with executemany instead of adding ORM objects one by one.
+    
+    Skips the unit of work's per-object bookkeeping, so inserted rows are not
+    loaded into the session. Rows in a batch should share the same keys.
+    
+    Args:
+        session: Database session
+        model: Mapped model class to insert into
+        rows: Column values for each row
+        batch_size: Number of rows sent per statement execution
+        
+    Returns:
+        Number of rows inserted
+    """
+    statement = insert(model)
+    iterator = iter(rows)
+    total = 0
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return total
+        session.execute(statement, batch)
+        total += len(batch)
+
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer and, with synchronous=NORMAL, fsyncs at checkpoints instead of on
+# every commit.
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", -64000),  # 64 MB
+    ("mmap_size", 268435456),  # 256 MB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Apply SQLITE_PRAGMAS to a new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+@lru_cache(maxsize=8)
+def _engine_for(db_path: str) -> Engine:
+    """Get the shared SQLite engine for a database, with tuned connection pragmas.
+    
+    One engine per path keeps its connection pool and compiled statement
+    cache alive across sessions.
+    """
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=8)
+def _sessionmaker_for(db_path: str) -> sessionmaker:
+    """Get the shared session factory for a database."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=_engine_for(db_path))
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    """Add columns introduced since a database was created to its existing tables.
+    
+    Only columns that are nullable or have a server default can be added.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for model_table in Base.metadata.sorted_tables:
+            if not inspector.has_table(model_table.name):
+                continue
+            
+            existing = {info["name"] for info in inspector.get_columns(model_table.name)}
+            for table_column in model_table.columns:
+                if table_column.name in existing:
+                    continue
+                if not table_column.nullable and table_column.server_default is None:
+                    continue
+                definition = CreateColumn(table_column).compile(dialect=engine.dialect)
+                connection.exec_driver_sql(f"ALTER TABLE {model_table.name} ADD COLUMN {definition}")
+
+
+def _convert_legacy_embeddings(engine: Engine) -> None:
+    """Repack embeddings stored as JSON text by older versions into float32 blobs."""
+    with engine.begin() as connection:
+        for model in (Article, Episode):
+            model_table = model.__table__
+            rows = connection.execute(
+                select(model_table.c.id, model_table.c.embedding)
+                .where(func.typeof(model_table.c.embedding) == "text")
+            ).all()
+            if rows:
+                connection.execute(
+                    update(model_table).where(model_table.c.id == bindparam("row_id")),
+                    [{"row_id": row_id, "embedding": pack_embedding(unpack_embedding(value))} for row_id, value in rows],
+                )
+
+
+# FTS5 index name -> (indexed table, indexed columns). Each index is an
+# external-content table kept in sync with its table by triggers.
+FULL_TEXT_INDEXES = {
+    "articles_fts": ("articles", ("title", "content", "summary")),
+    "episodes_fts": ("episodes", ("title", "description", "transcript")),
+}
+
+
+def _create_full_text_indexes(engine: Engine) -> None:
+    """Create the FULL_TEXT_INDEXES tables and their sync triggers if missing.
+    
+    A newly created index is rebuilt from the rows already in its table.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for fts, (content_table, columns) in FULL_TEXT_INDEXES.items():
+            if inspector.has_table(fts):
+                continue
+            
+            names = ", ".join(columns)
+            new_values = ", ".join(f"new.{name}" for name in columns)
+            old_values = ", ".join(f"old.{name}" for name in columns)
+            delete_row = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+            insert_row = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+            
+            connection.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{content_table}', "
+                f"content_rowid='id', tokenize='porter unicode61')"
+            )
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {content_table} BEGIN {insert_row} END"
+            )
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {content_table} BEGIN {delete_row} END"
+            )
+            # Only edits to indexed columns touch the index, not status updates
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {content_table} "
+                f"BEGIN {delete_row} {insert_row} END"
+            )
+            connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _fts_search(session: Session, model: Type[Any], fts: str, query: str, limit: Optional[int]) -> List[Any]:
+    """Select model rows matching a query against one of FULL_TEXT_INDEXES.
+    
+    Args:
+        session: Database session
+        model: Model class of the indexed table
+        fts: Name of the FTS5 table
+        query: FTS5 query
+        limit: Maximum number of rows to return
+        
+    Returns:
+        Matching model instances ordered by rank
+    """
+    index = table(fts, column("rowid"), column("rank"))
+    statement = (
+        select(model)
+        .join(index, index.c.rowid == model.id)
+        .where(text(f"{fts} MATCH :query").bindparams(query=query))
+        .order_by(index.c.rank)
+        .limit(limit)
+    )
+    return list(session.scalars(statement))
+
+
 def init_db(db_path: str) -> Engine:
     """Initialize database and create all tables."""
-    engine = create_engine(f"sqlite:///{db_path}")
+    engine = _engine_for(db_path)
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
+    _convert_legacy_embeddings(engine)
+    
+    # create_all skips existing tables, so add indexes introduced since a
+    # database was created
+    for model_table in Base.metadata.sorted_tables:
+        for index in model_table.indexes:
+            index.create(engine, checkfirst=True)
+    
+    _create_full_text_indexes(engine)
     return engine
 
 
 def get_db_session(db_path: str) -> Session:
     """Get a database session."""
-    engine = create_engine(f"sqlite:///{db_path}")
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
\ No newline at end of file
+    return _sessionmaker_for(db_path)()
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""HTTP utilities for Pedster."""
+
+from typing import Any, Collection, Optional
+
+import requests
+from dagster import get_dagster_logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+logger = get_dagster_logger()
+
+
+class LoggingRetry(Retry):
+    """Retry policy that logs each retried attempt."""
+
+    def increment(self, *args: Any, **kwargs: Any) -> Retry:
+        """Record a failed attempt and log the retry.
+
+        Args:
+            *args: Positional arguments for Retry.increment
+            **kwargs: Keyword arguments for Retry.increment
+
+        Returns:
+            Updated retry policy
+        """
+        new_retry = super().increment(*args, **kwargs)
+
+        attempt = len(new_retry.history)
+        last = new_retry.history[-1] if new_retry.history else None
+        if last is not None and last.error is not None:
+            cause = str(last.error)
+        elif last is not None:
+            cause = f"HTTP {last.status}"
+        else:
+            cause = "unknown error"
+        logger.warning(f"HTTP request to {last.url if last else ''} failed (attempt {attempt}): {cause}")
+
+        return new_retry
+
+
+def backoff_delay(backoff_factor: float, failures: int) -> float:
+    """Get the delay before retrying, on the same schedule as create_session.
+
+    Follows urllib3's Retry: no delay after the first failure, then
+    backoff_factor * 2 ** (failures - 1), capped at Retry.DEFAULT_BACKOFF_MAX.
+
+    Args:
+        backoff_factor: Backoff factor between retries
+        failures: Number of consecutive failed attempts so far
+
+    Returns:
+        Delay in seconds
+    """
+    if failures <= 1:
+        return 0.0
+    return min(Retry.DEFAULT_BACKOFF_MAX, backoff_factor * (2 ** (failures - 1)))
+
+
+def create_session(
+    pool_connections: int = 16,
+    pool_maxsize: int = 32,
+    total_retries: int = 2,
+    backoff_factor: float = 0.3,
+    status_forcelist: Collection[int] = (502, 503, 504),
+    allowed_methods: Optional[Collection[str]] = None,
+) -> requests.Session:
+    """Create a requests session with a pooled, retrying HTTP adapter.
+
+    Reusing the returned session keeps connections alive across requests
+    to the same host instead of paying a new TCP/TLS handshake per call.
+
+    Args:
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum connections kept per host pool
+        total_retries: Total retries for failed requests
+        backoff_factor: Backoff factor between retries
+        status_forcelist: HTTP status codes that trigger a retry
+        allowed_methods: HTTP methods to retry (defaults to idempotent methods)
+
+    Returns:
+        Configured requests session
+    """
+    retry = LoggingRetry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=(
+            frozenset(allowed_methods)
+            if allowed_methods is not None
+            else Retry.DEFAULT_ALLOWED_METHODS
+        ),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,59 +1,141 @@
 """Metrics utilities for tracking performance."""
 
 import functools
+import logging
+import os
+import random
 import time
-from typing import Any, Callable, Dict, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar, cast
 
-from dagster import get_dagster_logger
-from dagster.core.execution.stats import RunStepKeyStatsSnapshot
+from pedster.utils.models import PipelineData, ProcessorResult
 
-from pedster.utils.models import MetricsData, PipelineData, ProcessorResult
+
+if TYPE_CHECKING:
+    from dagster.core.execution.stats import RunStepKeyStatsSnapshot
 
 
 T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
-logger = get_dagster_logger()
+
+@functools.lru_cache(maxsize=1)
+def _get_logger() -> logging.Logger:
+    """Get the Dagster logger, importing Dagster on first use."""
+    from dagster import get_dagster_logger
+    
+    return get_dagster_logger()
 
 
-def track_metrics(func: F) -> F:
-    """Decorator to track execution metrics of a function."""
+# Set PEDSTER_METRICS_DISABLED=1 to leave decorated functions unwrapped
+METRICS_ENABLED = os.environ.get("PEDSTER_METRICS_DISABLED") != "1"
+
+
+def _update_pipeline_data(result: PipelineData, execution_time: float) -> None:
+    """Record execution time on a PipelineData result."""
+    result.metrics = result.metrics.with_call(execution_time)
+
+
+def _update_processor_result(result: ProcessorResult, execution_time: float) -> None:
+    """Record execution time on a ProcessorResult and its data."""
+    result.metrics = result.metrics.with_call(execution_time)
+    data = getattr(result, "data", None)
+    if getattr(data, "metrics", None) is not None:
+        data.metrics = data.metrics.with_call(execution_time)
+
+
+def _no_update(result: Any, execution_time: float) -> None:
+    """Ignore results that do not carry metrics."""
+
+
+# Metrics updater for each result type returned by tracked functions
+_METRICS_UPDATERS: Dict[type, Callable[[Any, float], None]] = {
+    PipelineData: _update_pipeline_data,
+    ProcessorResult: _update_processor_result,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _metrics_updater(result_type: type) -> Callable[[Any, float], None]:
+    """Get the metrics updater for a result type or its nearest base class."""
+    for base in result_type.__mro__:
+        updater = _METRICS_UPDATERS.get(base)
+        if updater is not None:
+            return updater
+    return _no_update
+
+
+def _timed(func: F) -> Callable[..., Any]:
+    """Wrap a function so each call is timed and its result's metrics updated."""
     
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = (time.time() - start_time) * 1000  # Convert to ms
+            execution_time = (time.perf_counter_ns() - start_time) / 1_000_000  # Convert to ms
             
             # Update metrics based on return type
-            if isinstance(result, PipelineData):
-                result.metrics.execution_time_ms = execution_time
-                result.metrics.call_count += 1
-            elif isinstance(result, ProcessorResult):
-                result.metrics.execution_time_ms = execution_time
-                result.metrics.call_count += 1
-                if hasattr(result, "data") and hasattr(result.data, "metrics"):
-                    result.data.metrics.execution_time_ms = execution_time
-                    result.data.metrics.call_count += 1
+            _metrics_updater(type(result))(result, execution_time)
             
-            logger.info(
-                f"Function {func.__name__} executed in {execution_time:.2f}ms"
-            )
+            logger = _get_logger()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Function {func.__name__} executed in {execution_time:.2f}ms"
+                )
             return result
             
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
-            logger.error(
+            execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            _get_logger().error(
                 f"Error in {func.__name__}: {str(e)} after {execution_time:.2f}ms"
             )
             raise
     
-    return cast(F, wrapper)
+    return timed
+
+
+def track_metrics(func: F) -> F:
+    """Decorator to track execution metrics of a function.
+    
+    Returns the function unchanged when metrics are disabled with
+    PEDSTER_METRICS_DISABLED=1.
+    """
+    if not METRICS_ENABLED:
+        return func
+    
+    return cast(F, functools.wraps(func)(_timed(func)))
+
+
+def sampled(rate: float = 0.01) -> Callable[[F], F]:
+    """Decorator to track execution metrics on a random sample of calls.
+    
+    Calls outside the sample run the function directly, without timing
+    or updating metrics.
+    
+    Args:
+        rate: Fraction of calls to time, between 0 and 1
+        
+    Returns:
+        Decorator for the function
+    """
+    def decorator(func: F) -> F:
+        if not METRICS_ENABLED:
+            return func
+        
+        timed = _timed(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if random.random() < rate:
+                return timed(*args, **kwargs)
+            return func(*args, **kwargs)
+        
+        return cast(F, wrapper)
+    
+    return decorator
 
 
-def get_step_metrics(stats: RunStepKeyStatsSnapshot) -> Dict[str, Any]:
+def get_step_metrics(stats: "RunStepKeyStatsSnapshot") -> Dict[str, Any]:
     """Extract useful metrics from Dagster step stats."""
     return {
         "step_key": stats.step_key,
@@ -62,4 +144,4 @@ def get_step_metrics(stats: RunStepKeyStatsSnapshot) -> Dict[str, Any]:
         "end_time": stats.end_time,
         "duration_ms": (stats.end_time - stats.start_time) * 1000 if stats.end_time else None,
         "attempts": len(stats.attempts),
-    }
\ No newline at end of file
+    }
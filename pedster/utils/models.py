@@ -2,9 +2,61 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_jsonable_python
+
+from pedster.utils.templates import compile_template
+
+
+@lru_cache(maxsize=None)
+def _fields_function(model: Type[BaseModel]) -> Callable[[BaseModel], Dict[str, Any]]:
+    """Generate a function returning a model's fields as a dict literal.
+    
+    The function is compiled once per model class, so reading the fields
+    needs no loop over the field names or getattr calls.
+    
+    Args:
+        model: Model class
+        
+    Returns:
+        Function mapping an instance of the model to a dict of its fields
+    """
+    items = ", ".join(f"{name!r}: self.{name}" for name in model.model_fields)
+    namespace: Dict[str, Any] = {}
+    exec(f"def fields(self):\n    return {{{items}}}", namespace)
+    return namespace["fields"]
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values orjson does not handle natively, such as nested models."""
+    if isinstance(value, BaseModel):
+        return _fields_function(type(value))(value)
+    return to_jsonable_python(value)
+
+
+class JsonModel(BaseModel):
+    """Base model with fast conversion to a JSON serializable dictionary."""
+
+    def to_json_bytes(self) -> bytes:
+        """Encode as JSON bytes.
+        
+        Serializes the fields with orjson, which handles datetimes, enums
+        and numpy arrays natively, instead of copying them with model_dump.
+        Fields are read by a function generated once per model class.
+        """
+        return orjson.dumps(
+            _fields_function(type(self))(self),
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        )
 
-from pydantic import BaseModel, Field
+    def to_json(self) -> Dict[str, Any]:
+        """Convert to JSON serializable dictionary."""
+        return orjson.loads(self.to_json_bytes())
 
 
 class ContentType(str, Enum):
@@ -19,8 +71,14 @@ class ContentType(str, Enum):
     JSON = "json"
 
 
-class MetricsData(BaseModel):
-    """Metrics data for tracking performance."""
+class MetricsData(JsonModel):
+    """Metrics data for tracking performance.
+    
+    Metrics are immutable so one default instance can be shared by every
+    model; record changes by replacing the metrics with an updated copy.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     execution_time_ms: float = 0.0
     tokens_in: Optional[int] = None
@@ -28,8 +86,29 @@ class MetricsData(BaseModel):
     call_count: int = 1
     errors: int = 0
 
+    def with_call(self, execution_time_ms: float) -> "MetricsData":
+        """Get a copy recording one more call and its execution time.
+        
+        Args:
+            execution_time_ms: Execution time of the call in milliseconds
+            
+        Returns:
+            Updated metrics
+        """
+        return self.model_copy(
+            update={"execution_time_ms": execution_time_ms, "call_count": self.call_count + 1}
+        )
+
+
+# Shared default metrics for new models
+DEFAULT_METRICS = MetricsData()
+
+
+# Fields PipelineData.bulk_new marks as explicitly set
+BULK_NEW_FIELDS = frozenset({"id", "content", "content_type", "source", "timestamp", "metadata"})
 
-class PipelineData(BaseModel):
+
+class PipelineData(JsonModel):
     """Base data model for all data passing through the pipeline."""
 
     id: str = Field(..., description="Unique identifier")
@@ -38,37 +117,90 @@ class PipelineData(BaseModel):
     source: str = Field(..., description="Source of the data")
     timestamp: datetime = Field(default_factory=datetime.now)
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    metrics: MetricsData = Field(default_factory=MetricsData)
-
-    def to_json(self) -> Dict[str, Any]:
-        """Convert to JSON serializable dictionary."""
-        return self.model_dump(mode="json")
-
-
-class ProcessorResult(BaseModel):
+    metrics: MetricsData = DEFAULT_METRICS
+
+    @classmethod
+    def bulk_new(
+        cls, rows: Iterable[Tuple[str, Any, ContentType, str, datetime, Dict[str, Any]]]
+    ) -> List["PipelineData"]:
+        """Build many instances from trusted values without validation.
+        
+        Args:
+            rows: (id, content, content_type, source, timestamp, metadata)
+                tuples, with values already of the field types
+                
+        Returns:
+            List of PipelineData, one per row
+        """
+        construct = cls.model_construct
+        # Pass the shared default metrics explicitly so model_construct does
+        # not copy the default for every row
+        return [
+            construct(
+                _fields_set=set(BULK_NEW_FIELDS),
+                id=id,
+                content=content,
+                content_type=content_type,
+                source=source,
+                timestamp=timestamp,
+                metadata=metadata,
+                metrics=DEFAULT_METRICS,
+            )
+            for id, content, content_type, source, timestamp, metadata in rows
+        ]
+
+
+class ProcessorResult(JsonModel):
     """Result from a processor operation."""
 
     data: PipelineData
     success: bool = True
     error_message: Optional[str] = None
-    metrics: MetricsData = Field(default_factory=MetricsData)
+    metrics: MetricsData = DEFAULT_METRICS
 
 
-class MapReduceResult(BaseModel):
+class MapReduceResult(JsonModel):
     """Result from a map-reduce operation."""
 
     results: List[ProcessorResult] = Field(default_factory=list)
     combined_content: Optional[Any] = None
-    metrics: MetricsData = Field(default_factory=MetricsData)
+    metrics: MetricsData = DEFAULT_METRICS
 
 
-class ObsidianConfig(BaseModel):
+class ObsidianConfig(JsonModel):
     """Configuration for Obsidian output."""
 
+    model_config = ConfigDict(frozen=True)
+
     vault_path: str
     folder: Optional[str] = None
     file_name: Optional[str] = None
     template: Optional[str] = None
     append: bool = False
     prepend: bool = False
-    replace: bool = False
\ No newline at end of file
+    replace: bool = False
+
+    def to_json_str(self) -> str:
+        """Encode as a JSON string, reusing the result for equal configs."""
+        return _frozen_json_str(self)
+
+    def render(self, **values: Any) -> str:
+        """Render the template with field values, e.g. title and content.
+        
+        The template is compiled once and reused for every render.
+        
+        Args:
+            **values: Values for the template fields
+            
+        Returns:
+            Rendered text, or the content value when no template is set
+        """
+        if self.template is None:
+            return str(values.get("content", ""))
+        return compile_template(self.template)(values)
+
+
+@lru_cache(maxsize=256)
+def _frozen_json_str(model: JsonModel) -> str:
+    """Encode a frozen, hashable model as a JSON string, cached by value."""
+    return model.to_json_bytes().decode()
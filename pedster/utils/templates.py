@@ -0,0 +1,68 @@
+"""Template formatting utilities for Pedster."""
+
+import string
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Compile a str.format template into a function of a values mapping.
+    
+    The template is parsed once per distinct template string; the returned
+    function only looks up and formats each field and joins the pieces.
+    Templates using positional, attribute, index or nested fields fall back
+    to str.format.
+    
+    Args:
+        template: Template using str.format syntax
+        
+    Returns:
+        Function formatting the template with a mapping of field values
+    """
+    parts: List[Tuple[str, Optional[str], str, Optional[str]]] = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (
+            not field_name.isidentifier() or "{" in (format_spec or "")
+        ):
+            return lambda values: template.format(**values)
+        parts.append((literal, field_name, format_spec or "", conversion))
+    
+    # Without format specs or conversions the template is a fixed list of
+    # segments; rendering only fills in the field slots and joins them
+    if all(not format_spec and conversion is None for _, _, format_spec, conversion in parts):
+        segments: List[str] = []
+        slots: List[Tuple[int, str]] = []
+        for literal, field_name, _, _ in parts:
+            if literal:
+                segments.append(literal)
+            if field_name is not None:
+                slots.append((len(segments), field_name))
+                segments.append("")
+        
+        def render_segments(values: Dict[str, Any]) -> str:
+            pieces = segments.copy()
+            for index, field_name in slots:
+                pieces[index] = format(values[field_name], "")
+            return "".join(pieces)
+        
+        return render_segments
+    
+    def format_template(values: Dict[str, Any]) -> str:
+        pieces = []
+        for literal, field_name, format_spec, conversion in parts:
+            if literal:
+                pieces.append(literal)
+            if field_name is None:
+                continue
+            value = values[field_name]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            pieces.append(format(value, format_spec))
+        return "".join(pieces)
+    
+    return format_template
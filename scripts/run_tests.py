@@ -12,6 +12,7 @@ import argparse
 import os
 import subprocess
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 
@@ -48,8 +49,8 @@ def parse_args() -> argparse.Namespace:
 
 def run_tests(args: argparse.Namespace) -> int:
     """Run tests with provided arguments."""
-    # Build pytest command
-    cmd = ["pytest"]
+    # Build pytest command, using the interpreter the checks ran against
+    cmd = [sys.executable, "-m", "pytest"]
     
     # Add verbosity
     if args.verbose:
@@ -92,24 +93,14 @@ def check_environment() -> None:
         sys.exit(1)
     
     # Check if pytest is installed
-    try:
-        subprocess.run(["pytest", "--version"], 
-                       stdout=subprocess.PIPE, 
-                       stderr=subprocess.PIPE, 
-                       check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if find_spec("pytest") is None:
         print("Error: pytest is not installed. Install with: pip install pytest", file=sys.stderr)
         sys.exit(1)
     
     # If coverage is requested, check if pytest-cov is installed
-    if "--coverage" in sys.argv or "-c" in sys.argv:
-        try:
-            subprocess.run(["pytest", "--cov=pedster"], 
-                           stdout=subprocess.PIPE, 
-                           stderr=subprocess.PIPE)
-        except subprocess.CalledProcessError:
-            print("Error: pytest-cov is not installed. Install with: pip install pytest-cov", file=sys.stderr)
-            sys.exit(1)
+    if ("--coverage" in sys.argv or "-c" in sys.argv) and find_spec("pytest_cov") is None:
+        print("Error: pytest-cov is not installed. Install with: pip install pytest-cov", file=sys.stderr)
+        sys.exit(1)
 
 
 def main() -> None:
@@ -18,6 +18,7 @@ Example:
 
 import argparse
 import os
+import shlex
 import sys
 from pathlib import Path
 from typing import Dict, Any
@@ -61,29 +62,38 @@ def flatten_config(config: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
     """Flatten nested TOML config into environment variables format."""
     env_vars = {}
     
-    for key, value in config.items():
-        env_key = f"{prefix}{key}".upper()
-        
-        if isinstance(value, dict):
-            # Recursively flatten nested dictionaries
-            nested_vars = flatten_config(value, f"{env_key}_")
-            env_vars.update(nested_vars)
-        elif isinstance(value, (list, tuple)):
-            # Convert lists to comma-separated values
-            env_vars[env_key] = ",".join(str(item) for item in value)
-        elif value is not None:
-            # Convert other values to strings
-            env_vars[env_key] = str(value)
+    # Walk nested tables with an explicit stack of (prefix, items) pairs,
+    # resuming the parent table after each nested one to keep key order
+    stack = [(prefix, iter(config.items()))]
+    while stack:
+        table_prefix, items = stack[-1]
+        for key, value in items:
+            env_key = f"{table_prefix}{key}".upper()
+            
+            if isinstance(value, dict):
+                # Descend into nested dictionaries
+                stack.append((f"{env_key}_", iter(value.items())))
+                break
+            elif isinstance(value, (list, tuple)):
+                # Convert lists to comma-separated values
+                env_vars[env_key] = ",".join(map(str, value))
+            elif isinstance(value, str):
+                env_vars[env_key] = value
+            elif value is not None:
+                # Convert other values to strings
+                env_vars[env_key] = str(value)
+        else:
+            stack.pop()
     
     return env_vars
 
 
 def print_env_exports(env_vars: Dict[str, str]) -> None:
     """Print environment variable export commands for shell evaluation."""
-    for key, value in env_vars.items():
-        # Escape single quotes in the value
-        escaped_value = value.replace("'", "'\\''")
-        print(f"export {key}='{escaped_value}';")
+    # Quote values for the shell and write all exports at once
+    exports = [f"export {key}={shlex.quote(value)};" for key, value in env_vars.items()]
+    if exports:
+        sys.stdout.write("\n".join(exports) + "\n")
 
 
 def main() -> None:
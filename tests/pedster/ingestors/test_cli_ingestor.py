@@ -32,7 +32,7 @@ class TestCLIIngestor(unittest.TestCase):
         self.assertEqual(ingestor.source_name, "custom_source")
         self.assertEqual(ingestor.content_type, ContentType.MARKDOWN)
     
-    @patch('sys.stdin', io.StringIO("Test input"))
+    @patch('sys.stdin', io.TextIOWrapper(io.BytesIO(b"Test input")))
     def test_ingest_with_input(self) -> None:
         """Test ingesting with input from stdin."""
         # Need to patch isatty to return False to simulate piped input
@@ -47,6 +47,51 @@ class TestCLIIngestor(unittest.TestCase):
             self.assertEqual(result[0].source, "cli")
             self.assertEqual(result[0].metadata.get("size"), 10)
     
+    @patch('sys.stdin', io.TextIOWrapper(io.BytesIO(b'{"key": "value"}')))
+    def test_ingest_json_input(self) -> None:
+        """Test ingesting JSON input from stdin."""
+        with patch('sys.stdin.isatty', return_value=False):
+            ingestor = CLIIngestor(config={"input_format": "json"})
+            result = ingestor.ingest()
+            
+            self.assertEqual(len(result), 1)
+            self.assertEqual(result[0].content, {"key": "value"})
+            self.assertEqual(result[0].metadata.get("size"), 16)
+    
+    def _ingest_bytes(self, data: bytes, config: dict) -> list:
+        """Ingest piped bytes with the given config."""
+        with patch('sys.stdin', io.TextIOWrapper(io.BytesIO(data))), \
+                patch('sys.stdin.isatty', return_value=False):
+            return CLIIngestor(config=config).ingest()
+    
+    def test_ingest_invalid_json(self) -> None:
+        """Test malformed JSON is rejected without raising."""
+        self.assertEqual(self._ingest_bytes(b'{"key": ', {"input_format": "json"}), [])
+    
+    def test_ingest_falsy_json(self) -> None:
+        """Test falsy JSON values are kept as content."""
+        for raw, expected in [(b"0", 0), (b"false", False), (b"[]", []), (b"{}", {})]:
+            with self.subTest(raw=raw):
+                result = self._ingest_bytes(raw, {"input_format": "json"})
+                self.assertEqual(len(result), 1)
+                self.assertEqual(result[0].content, expected)
+    
+    def test_ingest_json_size_in_characters(self) -> None:
+        """Test JSON size counts characters rather than bytes."""
+        raw = '{"key": "vålue"}'.encode("utf-8")
+        result = self._ingest_bytes(raw, {"input_format": "json", "max_size": 16})
+        self.assertEqual(result[0].content, {"key": "vålue"})
+        self.assertEqual(result[0].metadata.get("size"), 16)
+    
+    def test_ingest_truncates_to_max_size_characters(self) -> None:
+        """Test max_size counts characters and never splits one."""
+        result = self._ingest_bytes("héllo wörld".encode("utf-8"), {"max_size": 7})
+        self.assertEqual(result[0].content, "héllo w")
+        self.assertEqual(result[0].metadata.get("size"), 7)
+        
+        # JSON cut off by max_size is invalid and rejected
+        self.assertEqual(self._ingest_bytes(b'{"key": "value"}', {"input_format": "json", "max_size": 8}), [])
+    
     @patch('sys.stdin.isatty', return_value=True)
     def test_ingest_without_input(self, mock_isatty) -> None:
         """Test ingesting without input from stdin."""
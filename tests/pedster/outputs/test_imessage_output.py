@@ -0,0 +1,76 @@
+"""Tests for iMessage output."""
+
+import os
+import unittest
+from unittest import mock
+
+from pedster.outputs import imessage_output
+from pedster.outputs.imessage_output import IMessageOutput
+
+
+class TestIMessageOutput(unittest.TestCase):
+    """Test cases for iMessage output."""
+
+    def _make_output(self, max_length: int) -> IMessageOutput:
+        """Create an output configured for splitting."""
+        return IMessageOutput(
+            config={
+                "recipients": ["test@example.com"],
+                "max_length": max_length,
+                "truncate_long_messages": False,
+                "split_long_messages": True,
+            }
+        )
+
+    def test_init_requires_recipients(self) -> None:
+        """Test initialization without recipients."""
+        with self.assertRaises(ValueError):
+            IMessageOutput(config={})
+
+    def test_split_message_prefers_sentence_breaks(self) -> None:
+        """Test splitting on sentence boundaries."""
+        output = self._make_output(20)
+        chunks = output._split_message("Hello world. This is a test. And more text here.")
+
+        self.assertEqual(chunks, ["Hello world.", "This is a test.", "And more text here."])
+
+    def test_split_message_prefers_paragraph_breaks(self) -> None:
+        """Test splitting on paragraph boundaries."""
+        output = self._make_output(20)
+        chunks = output._split_message("para one\n\npara two. More\nline")
+
+        self.assertEqual(chunks[0], "para one")
+        self.assertTrue(all(len(chunk) <= 20 for chunk in chunks))
+
+    def test_split_message_hard_break(self) -> None:
+        """Test splitting text without any break characters."""
+        output = self._make_output(20)
+        chunks = output._split_message("a" * 50)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [20, 20, 10])
+        self.assertEqual("".join(chunks), "a" * 50)
+
+
+    def test_compiled_script_shared_between_outputs(self) -> None:
+        """Test the send script is compiled once and cleaned up at exit."""
+        imessage_output._compile_applescript.cache_clear()
+        self.addCleanup(imessage_output._compile_applescript.cache_clear)
+
+        with mock.patch("shutil.which", return_value="/usr/bin/osacompile"), \
+                mock.patch("subprocess.run") as run, \
+                mock.patch("atexit.register") as register:
+            first = self._make_output(20)
+            second = self._make_output(20)
+
+        run.assert_called_once()
+        self.assertEqual(first._osascript_command, second._osascript_command)
+        script_dir = os.path.dirname(first._osascript_command[1])
+        self.assertTrue(os.path.isdir(script_dir))
+
+        # Run the exit cleanup that was registered for the script
+        cleanup, *args = register.call_args.args
+        cleanup(*args, **register.call_args.kwargs)
+        self.assertFalse(os.path.exists(script_dir))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for Obsidian output."""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from pedster.outputs.obsidian_output import ObsidianOutput
+from pedster.utils.models import ContentType, PipelineData
+
+
+class TestObsidianOutput(unittest.TestCase):
+    """Test cases for Obsidian output."""
+
+    def setUp(self) -> None:
+        """Create a temporary vault."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.vault_path = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        """Remove the temporary vault."""
+        self.temp_dir.cleanup()
+
+    def _make_data(self, title: str, content: str = "Test content") -> PipelineData:
+        """Create pipeline data with a title."""
+        return PipelineData(
+            id="test-id",
+            content=content,
+            content_type=ContentType.TEXT,
+            source="test-source",
+            metadata={"title": title},
+        )
+
+    def _read(self, file_name: str) -> str:
+        """Read a note from the vault."""
+        with open(os.path.join(self.vault_path, file_name), encoding="utf-8") as f:
+            return f.read()
+
+    def test_init_requires_vault_path(self) -> None:
+        """Test initialization without vault_path."""
+        with self.assertRaises(ValueError):
+            ObsidianOutput(config={})
+
+    def test_output_creates_file_with_frontmatter(self) -> None:
+        """Test writing a new note with frontmatter."""
+        output = ObsidianOutput(config={"vault_path": self.vault_path, "tags": ["pedster"]})
+
+        self.assertTrue(output.output(self._make_data("My Note")))
+
+        content = self._read("My_Note.md")
+        self.assertTrue(content.startswith("---\n"))
+        self.assertIn('title: "My Note"\n', content)
+        self.assertIn("source: test-source\n", content)
+        self.assertIn("tags:\n  - pedster\n", content)
+        self.assertTrue(content.endswith("---\n\nTest content"))
+
+    def test_output_sanitizes_file_name(self) -> None:
+        """Test unsafe characters are replaced in file names."""
+        output = ObsidianOutput(config={"vault_path": self.vault_path})
+
+        self.assertTrue(output.output(self._make_data("a/b: c?")))
+
+        self.assertTrue(os.path.exists(os.path.join(self.vault_path, "a_b__c_.md")))
+
+    def test_output_append(self) -> None:
+        """Test appending to an existing note."""
+        output = ObsidianOutput(
+            config={"vault_path": self.vault_path, "append": True, "add_frontmatter": False, "add_timestamp": False}
+        )
+
+        output.output(self._make_data("Journal", "first"))
+        output.output(self._make_data("Journal", "second"))
+
+        self.assertEqual(self._read("Journal.md"), "first\n\nsecond")
+
+    def test_output_prepend(self) -> None:
+        """Test prepending to an existing note."""
+        output = ObsidianOutput(
+            config={"vault_path": self.vault_path, "prepend": True, "add_frontmatter": False, "add_timestamp": False}
+        )
+
+        output.output(self._make_data("Journal", "first"))
+        output.output(self._make_data("Journal", "second"))
+
+        self.assertEqual(self._read("Journal.md"), "second\n\nfirst")
+
+    def test_unique_file_keeps_existing_timestamped_file(self) -> None:
+        """Test a unique name never overwrites a file that already has it."""
+        output = ObsidianOutput(config={"vault_path": self.vault_path})
+        now = datetime(2024, 1, 2, 3, 4, 5)
+        note_path = os.path.join(self.vault_path, "Note.md")
+
+        output._write_unique_file(note_path, b"first", now)
+        output._write_unique_file(note_path, b"second", now)
+
+        self.assertEqual(self._read("Note_20240102030405.md"), "first")
+        self.assertEqual(self._read("Note_20240102030405_1.md"), "second")
+
+    def test_output_batch_unique_names_for_same_title(self) -> None:
+        """Test batch items with the same title each get their own note."""
+        output = ObsidianOutput(config={"vault_path": self.vault_path, "add_frontmatter": False, "add_timestamp": False})
+
+        results = output.output_batch([self._make_data("Note", f"item {n}") for n in range(3)])
+
+        self.assertEqual(results, [True, True, True])
+        contents = sorted(self._read(name) for name in os.listdir(self.vault_path))
+        self.assertEqual(contents, ["item 0", "item 1", "item 2"])
+
+    def test_output_async_append(self) -> None:
+        """Test asynchronous output creates and then appends to a note."""
+        output = ObsidianOutput(
+            config={"vault_path": self.vault_path, "append": True, "add_frontmatter": False, "add_timestamp": False}
+        )
+
+        async def write_notes() -> None:
+            self.assertTrue(await output.output_async(self._make_data("Journal", "first")))
+            self.assertTrue(await output.output_async(self._make_data("Journal", "second")))
+
+        asyncio.run(write_notes())
+
+        self.assertEqual(self._read("Journal.md"), "first\n\nsecond")
+
+    def test_output_batch_keeps_same_file_order(self) -> None:
+        """Test batch output writes items for the same file in order."""
+        output = ObsidianOutput(
+            config={"vault_path": self.vault_path, "append": True, "add_frontmatter": False, "add_timestamp": False}
+        )
+
+        results = output.output_batch([
+            self._make_data("Journal", "first"),
+            self._make_data("Other", "other"),
+            self._make_data("Journal", "second"),
+        ])
+
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(self._read("Journal.md"), "first\n\nsecond")
+        self.assertEqual(self._read("Other.md"), "other")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for the base processor."""
+
+import unittest
+
+from pedster.processors.base_processor import BaseProcessor
+from pedster.utils.metrics import track_metrics
+from pedster.utils.models import DEFAULT_METRICS, ContentType, PipelineData, ProcessorResult
+
+
+class EchoProcessor(BaseProcessor):
+    """Processor returning its input unchanged."""
+
+    def process(self, data: PipelineData) -> ProcessorResult:
+        """Return the input as the result."""
+        return self.create_result(data)
+
+
+class TestBaseProcessor(unittest.TestCase):
+    """Test cases for the base processor."""
+
+    def setUp(self) -> None:
+        """Create a processor and its input."""
+        self.processor = EchoProcessor("echo", "Echo input", ContentType.TEXT, ContentType.TEXT)
+        self.data = PipelineData(
+            id="test-id",
+            content="Test content",
+            content_type=ContentType.TEXT,
+            source="test-source",
+        )
+
+    def test_error_result_keeps_input_unchanged(self) -> None:
+        """Test tracking an error result doesn't record metrics on the input."""
+        fail = track_metrics(lambda data: self.processor.create_error_result(data, "boom"))
+
+        result = fail(self.data)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.data.content, "Test content")
+        self.assertEqual(result.data.metrics.call_count, 2)
+        self.assertIs(self.data.metrics, DEFAULT_METRICS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for LLM processors."""
+
+import unittest
+from typing import Any, Callable, Union
+from unittest import mock
+
+import httpx
+import orjson
+
+from pedster.processors.llm_processor import LLMProcessor, PromptTemplate
+from pedster.utils.models import ContentType, PipelineData
+
+
+def mock_async_client(handler: Callable[[httpx.Request], Any]) -> Any:
+    """Patch httpx.AsyncClient to send requests to a handler instead of the network."""
+    real_client = httpx.AsyncClient
+    return mock.patch(
+        "httpx.AsyncClient",
+        side_effect=lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
+def echo_handler(request: httpx.Request) -> httpx.Response:
+    """Answer a chat completion request with its user message."""
+    payload = orjson.loads(request.content)
+    return httpx.Response(200, json={
+        "model": payload["model"],
+        "choices": [{"message": {"content": payload["messages"][-1]["content"]}}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2},
+    })
+
+
+class TestLLMProcessor(unittest.TestCase):
+    """Test cases for the LLM processor."""
+
+    def make_processor(
+        self, template: Union[str, PromptTemplate] = "Summarize: {content}", **config: Any
+    ) -> LLMProcessor:
+        """Create a processor with an API key and a single attempt per call."""
+        return LLMProcessor(
+            name="summarizer",
+            description="Summarize content",
+            model="test/model",
+            prompt_template=template,
+            config={"api_key": "test-key", "retry_count": 1, **config},
+        )
+
+    def make_data(self, content: str, **metadata: Any) -> PipelineData:
+        """Create text data to process."""
+        return PipelineData(
+            id=content,
+            content=content,
+            content_type=ContentType.TEXT,
+            source="test-source",
+            metadata=metadata,
+        )
+
+    def test_prepare_messages_substitutes_in_one_pass(self) -> None:
+        """Test placeholders are filled once, leaving other braces alone."""
+        template = PromptTemplate(
+            template='By {author}: {content} {unknown} {"format": "json"}',
+            system_message="Be brief.",
+            input_variables=["content", "author", "unknown"],
+        )
+        processor = self.make_processor(template, enable_prompt_cache=False)
+
+        messages = processor._prepare_messages("quotes {author}", {"author": "Ann"})
+
+        self.assertEqual(messages, [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": 'By Ann: quotes {author} {unknown} {"format": "json"}'},
+        ])
+
+    def test_build_request_reuses_static_payload(self) -> None:
+        """Test each request adds its messages to the fixed settings."""
+        processor = self.make_processor(stop=["END"], temperature=0.2)
+        first = [{"role": "user", "content": "one"}]
+        second = [{"role": "user", "content": "two"}]
+
+        url, payload = processor._build_request(first)
+        _, other_payload = processor._build_request(second)
+
+        self.assertEqual(url, "https://openrouter.ai/api/v1/chat/completions")
+        self.assertEqual(payload, {
+            "model": "test/model",
+            "temperature": 0.2,
+            "max_tokens": 1000,
+            "top_p": 0.95,
+            "frequency_penalty": 0.0,
+            "presence_penalty": 0.0,
+            "stop": ["END"],
+            "messages": first,
+        })
+        self.assertEqual(other_payload["messages"], second)
+        self.assertNotIn("messages", processor._static_payload)
+
+    def test_process_batch_keeps_order(self) -> None:
+        """Test batch results come back in input order with model metadata."""
+        processor = self.make_processor()
+        items = [self.make_data(f"item {i}") for i in range(5)]
+
+        with mock_async_client(echo_handler):
+            results = processor.process_batch(items)
+
+        self.assertEqual([result.data.content for result in results], [f"Summarize: item {i}" for i in range(5)])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].data.metadata["model"], "test/model")
+        self.assertEqual(results[0].data.metrics.tokens_in, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Tests for the map-reduce processor."""
+
+import asyncio
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+import httpx
+import orjson
+
+from pedster.processors.llm_processor import LLMProcessor
+from pedster.processors.map_reduce_processor import MapReduceProcessor
+from pedster.utils.models import ContentType, PipelineData
+from tests.pedster.processors.test_llm_processor import mock_async_client
+
+
+class TestMapReduceProcessor(unittest.TestCase):
+    """Test cases for the map-reduce processor."""
+
+    def setUp(self) -> None:
+        """Create the input and a record of the requests sent."""
+        self.data = PipelineData(
+            id="test-id",
+            content="Test content",
+            content_type=ContentType.TEXT,
+            source="test-source",
+        )
+        self.requests: List[Dict[str, Any]] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer by model: "slow" never finishes, "bad" fails, others echo."""
+        payload = orjson.loads(request.content)
+        self.requests.append(payload)
+        model = payload["model"]
+        if model == "slow":
+            await asyncio.sleep(30)
+        if model == "bad":
+            return httpx.Response(400, json={"error": "bad request"})
+        return httpx.Response(200, json={
+            "model": model,
+            "choices": [{"message": {"content": f"{model}: {payload['messages'][-1]['content']}"}}],
+        })
+
+    def make_llm(self, name: str, model: str) -> LLMProcessor:
+        """Create an LLM processor making a single attempt per call."""
+        return LLMProcessor(
+            name=name,
+            description=f"{name} processor",
+            model=model,
+            prompt_template="{content}",
+            config={"api_key": "test-key", "retry_count": 1},
+        )
+
+    def run_map_reduce(self, processors: List[LLMProcessor], **config: Any) -> Any:
+        """Process the input with the processors over the mocked transport."""
+        processor = MapReduceProcessor("map_reduce", "Combine models", processors, config=config)
+        with mock_async_client(self.handler):
+            return processor, processor.process(self.data)
+
+    def test_combines_results_in_processor_order(self) -> None:
+        """Test markdown output has one section per processor, in order."""
+        _, result = self.run_map_reduce([self.make_llm("first", "a"), self.make_llm("second", "b")])
+
+        content = result.data.content
+        self.assertTrue(content.startswith("# Combined Results\n\n## first (a)\n\na: Test content\n\n"))
+        self.assertLess(content.index("## first (a)"), content.index("## second (b)"))
+        self.assertIn("b: Test content\n\n", content)
+        self.assertEqual(content.count("---\n\n"), 2)
+
+    def test_combines_text_results(self) -> None:
+        """Test text output joins the processor outputs."""
+        _, result = self.run_map_reduce(
+            [self.make_llm("first", "a"), self.make_llm("second", "b")], output_format="text"
+        )
+
+        self.assertEqual(result.data.content, "a: Test content\n\nb: Test content")
+
+    def test_identical_requests_are_shared(self) -> None:
+        """Test processors sending the same request make one call between them."""
+        processor, result = self.run_map_reduce(
+            [self.make_llm("first", "a"), self.make_llm("second", "a")], output_format="text"
+        )
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(result.data.content, "a: Test content\n\na: Test content")
+
+    def test_timed_out_processors_are_failures(self) -> None:
+        """Test a processor still running at the timeout is kept as a failure."""
+        processor = MapReduceProcessor(
+            "map_reduce",
+            "Combine models",
+            [self.make_llm("fast", "a"), self.make_llm("stuck", "slow")],
+            config={"timeout": 1},
+        )
+
+        with mock_async_client(self.handler):
+            results = asyncio.run(processor._amap(self.data))
+
+        self.assertEqual([name for name, _ in results], ["fast", "stuck"])
+        self.assertTrue(results[0][1].success)
+        self.assertFalse(results[1][1].success)
+        self.assertEqual(results[1][1].error_message, "stuck timed out after 1s")
+
+    def test_fail_fast_cancels_remaining_processors(self) -> None:
+        """Test a failure stops processors that are still running."""
+        processor = MapReduceProcessor(
+            "map_reduce",
+            "Combine models",
+            [self.make_llm("broken", "bad"), self.make_llm("stuck", "slow")],
+            config={"fail_fast": True},
+        )
+
+        with mock_async_client(self.handler):
+            results = asyncio.run(processor._amap(self.data))
+
+        self.assertFalse(results[0][1].success)
+        self.assertIn("LLM error", results[0][1].error_message)
+        self.assertFalse(results[1][1].success)
+        self.assertEqual(results[1][1].error_message, "stuck cancelled after another processor failed")
+
+    def test_fail_fast_stops_sequential_processing(self) -> None:
+        """Test sequential processing skips the processors after a failure."""
+        broken, never = self.make_llm("broken", "bad"), self.make_llm("never", "a")
+        processor = MapReduceProcessor(
+            "map_reduce", "Combine models", [broken, never], config={"parallel": False, "fail_fast": True}
+        )
+
+        with mock.patch.object(broken, "_call_openrouter", side_effect=Exception("bad request")), \
+                mock.patch.object(never, "_call_openrouter") as never_call:
+            result = processor.process(self.data)
+
+        never_call.assert_not_called()
+        self.assertIn("## broken\n", result.data.content)
+        self.assertNotIn("never", result.data.content)
+
+
+if __name__ == '__main__':
+    unittest.main()
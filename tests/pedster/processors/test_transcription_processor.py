@@ -0,0 +1,63 @@
+"""Tests for transcription processor."""
+
+import unittest
+
+from pedster.processors.transcription_processor import (
+    TranscriptionProcessor, _filter_segments, _truncate_repetition
+)
+
+
+class TestTranscriptionFilters(unittest.TestCase):
+    """Test cases for transcription hallucination filters."""
+
+    def test_truncate_repetition(self) -> None:
+        """Test a repeated n-gram loop is cut after its first occurrence."""
+        looping = " and then we went" + " to the store" * 6
+        self.assertEqual(_truncate_repetition(looping), " and then we went to the store")
+
+        text = " to the store and back to the store"
+        self.assertEqual(_truncate_repetition(text), text)
+
+    def test_filter_segments_drops_boilerplate(self) -> None:
+        """Test boilerplate segments are dropped."""
+        segments = [
+            {"id": 0, "start": 0.0, "end": 2.0, "text": " Welcome back."},
+            {"id": 1, "start": 2.0, "end": 4.0, "text": " Thanks for watching!"},
+        ]
+
+        self.assertEqual(_filter_segments(segments), segments[:1])
+
+
+
+class TestCorrectionParsing(unittest.TestCase):
+    """Test cases for parsing transcript correction responses."""
+
+    def parse(self, content: str) -> tuple:
+        """Parse a correction response with the given message content."""
+        response = {"choices": [{"message": {"content": content}}]}
+        return TranscriptionProcessor._parse_correction(response, "raw transcript", "Physics")
+
+    def test_parse_correction(self) -> None:
+        """Test the transcript and changes are split at the changes header."""
+        transcript, info = self.parse("CORRECTED TRANSCRIPT:\nfixed text\nCHANGES MADE:\n- one")
+
+        self.assertEqual(transcript, "fixed text")
+        self.assertEqual(info, {"domain": "Physics", "corrections": "- one"})
+
+    def test_parse_correction_with_preamble(self) -> None:
+        """Test text before the transcript header is not kept."""
+        transcript, info = self.parse("Here it is:\nCORRECTED TRANSCRIPT:\nfoo\nCHANGES MADE: x")
+
+        self.assertEqual(transcript, "foo")
+        self.assertEqual(info["corrections"], "x")
+
+    def test_parse_correction_without_changes(self) -> None:
+        """Test a malformed response keeps the raw transcript."""
+        transcript, info = self.parse("just some text")
+
+        self.assertEqual(transcript, "raw transcript")
+        self.assertEqual(info["corrections"], "Error in correction format")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for the semantic cache."""
+
+import unittest
+from typing import List
+
+from pedster.utils.cache import SemanticCache
+
+
+# Tiny deterministic embeddings keyed by text
+EMBEDDINGS = {
+    "summarize the article": [1.0, 0.0, 0.0],
+    "summarise the article": [0.99, 0.1, 0.0],
+    "translate the article": [0.0, 1.0, 0.0],
+}
+
+
+
+def truncating_embed(text: str) -> List[float]:
+    """Embed like a model that only sees the first 256 words."""
+    words = text.split()[:256]
+    return [float(len(words)), float(sum(len(word) for word in words)), 1.0]
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Test cases for the semantic cache."""
+    
+    def setUp(self) -> None:
+        """Create a cache with fake embeddings."""
+        self.cache = SemanticCache(capacity=2, threshold=0.95, embed=EMBEDDINGS.__getitem__)
+    
+    def test_exact_and_similar_hits(self) -> None:
+        """Test exact and near-duplicate prompts hit the cache."""
+        value, embedding = self.cache.lookup("model", "summarize the article")
+        self.assertIsNone(value)
+        self.cache.store("model", "summarize the article", "summary", embedding)
+        
+        self.assertEqual(self.cache.lookup("model", "summarize the article")[0], "summary")
+        self.assertEqual(self.cache.lookup("model", "summarise the article")[0], "summary")
+        self.assertIsNone(self.cache.lookup("model", "translate the article")[0])
+        self.assertIsNone(self.cache.lookup("other-model", "summarize the article")[0])
+    
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the oldest entry is evicted when the cache is full."""
+        self.cache.store("model", "summarize the article", "summary")
+        self.cache.store("model", "translate the article", "translation")
+        self.cache.lookup("model", "summarize the article")
+        self.cache.store("other-model", "translate the article", "other")
+        
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.lookup("model", "summarize the article")[0], "summary")
+        self.assertIsNone(self.cache.lookup("model", "translate the article")[0])
+
+    
+    def test_long_prompts_only_match_exactly(self) -> None:
+        """Test prompts past the embedding limit don't match on a shared prefix."""
+        cache = SemanticCache(
+            threshold=0.95,
+            embed=truncating_embed,
+            count_tokens=lambda text: len(text.split()),
+            max_tokens=256,
+        )
+        template = "Summarize this article. " * 100
+        first = template + "The first article is about databases."
+        second = template + "The second article is about cooking pasta."
+        
+        value, embedding = cache.lookup("model", first)
+        self.assertIsNone(value)
+        self.assertIsNone(embedding)
+        cache.store("model", first, "database summary", embedding)
+        
+        self.assertIsNone(cache.lookup("model", second)[0])
+        self.assertEqual(cache.lookup("model", first)[0], "database summary")
+
+
+if __name__ == '__main__':
+    unittest.main()
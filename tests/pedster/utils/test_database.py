@@ -0,0 +1,133 @@
+"""Tests for database models."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from pedster.utils.database import (
+    Article, Base, Episode, Feed, Message, MessageThread, Podcast, _create_full_text_indexes, init_db
+)
+
+
+class TestDatabase(unittest.TestCase):
+    """Test cases for database models."""
+
+    def setUp(self) -> None:
+        """Create an in-memory database."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        _create_full_text_indexes(engine)
+        self.session = sessionmaker(bind=engine)()
+
+    def tearDown(self) -> None:
+        """Close the session."""
+        self.session.close()
+
+    def test_relationships_are_not_lazy_loaded(self) -> None:
+        """Test relationships must be loaded eagerly."""
+        podcast = Podcast(title="Show", author="Host", feed_url="https://example.com/feed")
+        self.session.add(Episode(podcast=podcast, guid="ep-1", title="Episode 1"))
+        self.session.commit()
+        self.session.expunge_all()
+
+        episode = self.session.query(Episode).one()
+        with self.assertRaises(InvalidRequestError):
+            episode.to_pipeline_data()
+
+        self.session.expunge_all()
+        episode = self.session.query(Episode).options(joinedload(Episode.podcast)).one()
+        self.assertEqual(episode.to_pipeline_data().source, "podcast:Show")
+
+    def test_pending_message_uses_assigned_thread(self) -> None:
+        """Test a new message converts using the thread it was created with."""
+        thread = MessageThread(thread_id="chat-1", name="Friends", is_group=True)
+        self.session.add(thread)
+        self.session.commit()
+
+        message = Message(thread=thread, message_id="m-1", text="hi", date=datetime(2024, 1, 1))
+        self.session.add(message)
+
+        self.assertEqual(message.to_pipeline_data().metadata["thread_name"], "Friends")
+
+    def test_bulk_to_pipeline_data_matches_per_row(self) -> None:
+        """Test bulk conversion builds the same data as per-row conversion."""
+        feed = Feed(title="Blog", url="https://example.com/rss")
+        self.session.add_all([
+            Article(feed=feed, title="One", url="https://example.com/1", guid="a-1", content="first"),
+            Article(feed=feed, title="Two", url="https://example.com/2", guid="a-2", processed=True),
+        ])
+        self.session.commit()
+
+        bulk = Article.bulk_to_pipeline_data(self.session, Article.processed.is_(False))
+        article = self.session.query(Article).options(joinedload(Article.feed)).filter_by(guid="a-1").one()
+
+        self.assertEqual(len(bulk), 1)
+        self.assertEqual(bulk[0].model_dump(exclude={"metrics"}), article.to_pipeline_data().model_dump(exclude={"metrics"}))
+
+
+    def test_search_follows_article_changes(self) -> None:
+        """Test full-text search sees inserted, updated and deleted articles."""
+        feed = Feed(title="Blog", url="https://example.com/rss")
+        first = Article(feed=feed, title="Databases", url="https://example.com/1", guid="a-1", content="indexing rows")
+        second = Article(feed=feed, title="Cooking", url="https://example.com/2", guid="a-2", content="pasta")
+        self.session.add_all([first, second])
+        self.session.commit()
+
+        self.assertEqual([article.guid for article in Article.search(self.session, "index")], ["a-1"])
+
+        second.content = "an index of recipes"
+        self.session.delete(first)
+        self.session.commit()
+
+        self.assertEqual([article.guid for article in Article.search(self.session, "index")], ["a-2"])
+
+
+    def test_refresh_stats_recounts_feeds(self) -> None:
+        """Test feed statistics are recomputed from their articles."""
+        feed = Feed(title="Blog", url="https://example.com/rss", article_count=7)
+        empty = Feed(title="Quiet", url="https://example.com/quiet", article_count=3)
+        self.session.add_all([
+            feed,
+            empty,
+            Article(feed=feed, title="One", url="https://example.com/1", guid="a-1", quality_tier="S", quality_score=90),
+            Article(feed=feed, title="Two", url="https://example.com/2", guid="a-2", quality_tier="B", quality_score=60),
+            Article(feed=feed, title="Three", url="https://example.com/3", guid="a-3", quality_tier="S", quality_score=81),
+        ])
+        self.session.commit()
+
+        self.assertEqual(Feed.refresh_stats(self.session), 1)
+        self.session.commit()
+
+        self.assertEqual(feed.article_count, 3)
+        self.assertEqual(feed.avg_quality_score, 77.0)
+        self.assertEqual(feed.quality_tier_counts, {"S": 2, "A": 0, "B": 1, "C": 0, "D": 0})
+        self.assertEqual(empty.article_count, 3)
+
+    def test_init_db_converts_legacy_embeddings(self) -> None:
+        """Test JSON text embeddings from older versions are repacked as blobs."""
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        db_path = os.path.join(db_dir.name, "pedster.db")
+        engine = init_db(db_path)
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO feeds (id, title, url) VALUES (1, 'Blog', 'https://example.com/rss')"))
+            connection.execute(text(
+                "INSERT INTO articles (id, feed_id, title, url, guid, embedding) "
+                "VALUES (1, 1, 'One', 'https://example.com/1', 'a-1', '[0.5, -1.0]')"
+            ))
+
+        init_db(db_path)
+
+        session = sessionmaker(bind=engine)()
+        self.addCleanup(session.close)
+        article = session.get(Article, 1)
+        self.assertIsInstance(article.embedding, bytes)
+        self.assertEqual(article.embedding_vec.tolist(), [0.5, -1.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for metrics utilities."""
+
+import unittest
+from unittest import mock
+
+from pedster.utils import metrics
+from pedster.utils.metrics import sampled, track_metrics
+from pedster.utils.models import ContentType, PipelineData
+
+
+class TaggedPipelineData(PipelineData):
+    """PipelineData subclass used to check metrics on derived result types."""
+
+
+class TestTrackMetrics(unittest.TestCase):
+    """Test cases for the track_metrics decorator."""
+    
+    def make_data(self, data_cls: type = PipelineData) -> PipelineData:
+        """Create pipeline data for a tracked function to return."""
+        return data_cls(
+            id="test-id",
+            content="Test content",
+            content_type=ContentType.TEXT,
+            source="test-source",
+        )
+    
+    def test_updates_pipeline_data_metrics(self) -> None:
+        """Test a tracked call records one more call on its result."""
+        tracked = track_metrics(self.make_data)
+        
+        result = tracked()
+        
+        self.assertEqual(result.metrics.call_count, 2)
+        self.assertGreaterEqual(result.metrics.execution_time_ms, 0.0)
+    
+    def test_updates_subclass_metrics(self) -> None:
+        """Test results of a subclass of a tracked type are updated too."""
+        tracked = track_metrics(self.make_data)
+        
+        result = tracked(TaggedPipelineData)
+        
+        self.assertIsInstance(result, TaggedPipelineData)
+        self.assertEqual(result.metrics.call_count, 2)
+    
+    def test_ignores_other_results(self) -> None:
+        """Test results without metrics are returned unchanged."""
+        tracked = track_metrics(lambda: {"key": "value"})
+        
+        self.assertEqual(tracked(), {"key": "value"})
+    
+    def test_disabled_returns_function_unwrapped(self) -> None:
+        """Test functions are left undecorated when metrics are disabled."""
+        func = self.make_data
+        
+        with mock.patch.object(metrics, "METRICS_ENABLED", False):
+            self.assertIs(track_metrics(func), func)
+            self.assertIs(sampled()(func), func)
+    
+    def test_sampled_times_calls_in_sample(self) -> None:
+        """Test sampled only updates metrics for calls inside the sample."""
+        tracked = sampled(rate=0.5)(self.make_data)
+        
+        with mock.patch("random.random", return_value=0.4):
+            self.assertEqual(tracked().metrics.call_count, 2)
+        with mock.patch("random.random", return_value=0.6):
+            self.assertEqual(tracked().metrics.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,84 +11,94 @@ from pedster.utils.models import (ContentType, MapReduceResult, MetricsData,
 class TestModels(unittest.TestCase):
     """Test cases for data models."""
     
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the pipeline data shared by the tests, which only read it."""
+        cls.pipeline_data = PipelineData(
+            id="test-id",
+            content="Test content",
+            content_type=ContentType.TEXT,
+            source="test-source",
+            metadata={"key": "value"},
+        )
+    
+    def assert_default_metrics(self, metrics: MetricsData) -> None:
+        """Assert metrics have their initial values."""
+        self.assertIsInstance(metrics, MetricsData)
+        self.assertEqual(metrics.execution_time_ms, 0.0)
+        self.assertEqual(metrics.call_count, 1)
+    
     def test_pipeline_data(self) -> None:
         """Test PipelineData model."""
-        # Create a PipelineData instance
-        data = PipelineData(
+        data = self.pipeline_data
+        
+        # Check attributes with a single structural comparison
+        expected = PipelineData(
             id="test-id",
             content="Test content",
             content_type=ContentType.TEXT,
             source="test-source",
+            timestamp=data.timestamp,
             metadata={"key": "value"},
         )
-        
-        # Check attributes
-        self.assertEqual(data.id, "test-id")
-        self.assertEqual(data.content, "Test content")
-        self.assertEqual(data.content_type, ContentType.TEXT)
-        self.assertEqual(data.source, "test-source")
-        self.assertEqual(data.metadata, {"key": "value"})
+        self.assertEqual(data, expected)
         
         # Check metrics initialization
-        self.assertIsInstance(data.metrics, MetricsData)
-        self.assertEqual(data.metrics.execution_time_ms, 0.0)
-        self.assertEqual(data.metrics.call_count, 1)
-        
-        # Test to_json method
-        json_data = data.to_json()
+        self.assert_default_metrics(data.metrics)
+    
+    def test_pipeline_data_to_json(self) -> None:
+        """Test PipelineData serialization."""
+        json_data = self.pipeline_data.to_json()
         self.assertIsInstance(json_data, dict)
-        self.assertEqual(json_data["id"], "test-id")
-        self.assertEqual(json_data["content"], "Test content")
-        self.assertEqual(json_data["content_type"], "text")
+        for field, expected in [
+            ("id", "test-id"),
+            ("content", "Test content"),
+            ("content_type", "text"),
+        ]:
+            with self.subTest(field=field):
+                self.assertEqual(json_data[field], expected)
         
         # Ensure it's JSON serializable
         json_str = json.dumps(json_data)
         self.assertIsInstance(json_str, str)
+        
+        # Encoded bytes decode to the same dictionary
+        self.assertEqual(json.loads(self.pipeline_data.to_json_bytes()), json_data)
+    
+    def test_pipeline_data_bulk_new(self) -> None:
+        """Test bulk construction matches regular construction."""
+        data = self.pipeline_data
+        
+        built = PipelineData.bulk_new([
+            (data.id, data.content, data.content_type, data.source, data.timestamp, {"key": "value"}),
+        ])
+        
+        self.assertEqual(built, [data])
+        self.assertEqual(built[0].model_copy(update={"id": "other"}).id, "other")
     
     def test_processor_result(self) -> None:
         """Test ProcessorResult model."""
-        # Create a PipelineData instance
-        pipeline_data = PipelineData(
-            id="test-id",
-            content="Test content",
-            content_type=ContentType.TEXT,
-            source="test-source",
-        )
-        
-        # Create a ProcessorResult instance
         result = ProcessorResult(
-            data=pipeline_data,
+            data=self.pipeline_data,
             success=True,
             error_message=None,
         )
         
         # Check attributes
-        self.assertEqual(result.data, pipeline_data)
+        self.assertEqual(result.data, self.pipeline_data)
         self.assertTrue(result.success)
         self.assertIsNone(result.error_message)
         
         # Check metrics initialization
-        self.assertIsInstance(result.metrics, MetricsData)
-        self.assertEqual(result.metrics.execution_time_ms, 0.0)
-        self.assertEqual(result.metrics.call_count, 1)
+        self.assert_default_metrics(result.metrics)
     
     def test_map_reduce_result(self) -> None:
         """Test MapReduceResult model."""
-        # Create a PipelineData instance
-        pipeline_data = PipelineData(
-            id="test-id",
-            content="Test content",
-            content_type=ContentType.TEXT,
-            source="test-source",
-        )
-        
-        # Create a ProcessorResult instance
         processor_result = ProcessorResult(
-            data=pipeline_data,
+            data=self.pipeline_data,
             success=True,
         )
         
-        # Create a MapReduceResult instance
         map_reduce_result = MapReduceResult(
             results=[processor_result],
             combined_content="Combined content",
@@ -100,9 +110,7 @@ class TestModels(unittest.TestCase):
         self.assertEqual(map_reduce_result.combined_content, "Combined content")
         
         # Check metrics initialization
-        self.assertIsInstance(map_reduce_result.metrics, MetricsData)
-        self.assertEqual(map_reduce_result.metrics.execution_time_ms, 0.0)
-        self.assertEqual(map_reduce_result.metrics.call_count, 1)
+        self.assert_default_metrics(map_reduce_result.metrics)
     
     def test_obsidian_config(self) -> None:
         """Test ObsidianConfig model."""
@@ -123,7 +131,10 @@ class TestModels(unittest.TestCase):
         self.assertTrue(config.append)
         self.assertFalse(config.prepend)
         self.assertFalse(config.replace)
+        
+        # Check template rendering
+        self.assertEqual(config.render(title="Title", content="Body"), "# Title\n\nBody")
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()